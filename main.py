@@ -1,7 +1,7 @@
 # FILE: main.py
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any
 
 
@@ -48,7 +48,7 @@ TEAMS = {
 #  DATA STRUCTURES
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class PredictionResult:
     """Container for prediction output."""
     engine_version: str
@@ -61,7 +61,18 @@ class PredictionResult:
     notes: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat record: build the dict directly instead of asdict()'s
+        # recursive field walk + deepcopy.
+        return {
+            "engine_version": self.engine_version,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "model_spread": self.model_spread,
+            "model_total": self.model_total,
+            "confidence": self.confidence,
+            "volatility_flag": self.volatility_flag,
+            "notes": self.notes,
+        }
 
 
 # ============================================================
@@ -6,6 +6,14 @@ Public API:
     from pist01beat import Pist01Beat
 """
 
-from .model import Pist01Beat
-
 __all__ = ["Pist01Beat"]
+
+
+def __getattr__(name):
+    # Resolved lazily so `pist01beat.ops` CLIs (infra-only, no engine use)
+    # don't pay for importing the engine stack at startup.
+    if name == "Pist01Beat":
+        from .model import Pist01Beat
+
+        return Pist01Beat
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
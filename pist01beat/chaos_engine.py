@@ -15,18 +15,60 @@ Interface:
     engine = ChaosEngine()
     result = engine.compute_chaos("HOR", "DEN")
     # result.chaos_score, result.chaos_flag, result.debug
+
+    batch = engine.compute_chaos_batch(["HOR", "NYK"], ["DEN", "DET"])
+    # batch["chaos_score"], batch["chaos_flag"] (parallel lists)
+
+    from pist01beat.chaos_engine import compute_chaos_matchup
+    frozen = compute_chaos_matchup("HOR", "DEN")  # memoized, read-only dict
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional
+import functools
+from dataclasses import dataclass
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
+
+from .utils import MATCHUP_CACHE_SIZE, copy_containers, deep_freeze, team_code_hash
 
 
 ENGINE_VERSION = "3.4-chaos"
 
+# Flag labels indexed by the kernel's flag_id.
+_FLAGS = ("LOW", "MEDIUM", "HIGH")
 
-@dataclass
+
+def _chaos_raw_hash(home_hash: int, away_hash: int) -> int:
+    """
+    Order-sensitive mix of two team hashes into 0..999.
+    The single definition used by every chaos path.
+    """
+    return (home_hash * 31 + away_hash * 17) % 1000
+
+
+def _chaos_kernel(
+    base_score: float,
+    boost: float,
+    low: float,
+    high: float,
+) -> Tuple[float, int]:
+    """
+    Pure numeric core shared by compute_chaos and compute_chaos_batch.
+
+    Returns (chaos_score, flag_id) where flag_id indexes _FLAGS.
+    Takes only numbers, so it can be JIT-compiled without touching callers.
+    """
+    score = base_score + boost
+    # clamp to [0, 1]
+    if score < 0.0:
+        score = 0.0
+    elif score > 1.0:
+        score = 1.0
+    flag_id = 0 if score < low else 1 if score < high else 2
+    return score, flag_id
+
+
+@dataclass(slots=True)
 class ChaosResult:
     engine: str
     engine_version: str
@@ -38,7 +80,31 @@ class ChaosResult:
     debug: Dict[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Build the dict directly instead of asdict()'s recursive deepcopy;
+        # nested containers (debug, drivers) are shared with this result.
+        return {
+            "engine": self.engine,
+            "engine_version": self.engine_version,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "chaos_score": self.chaos_score,
+            "chaos_flag": self.chaos_flag,
+            "drivers": self.drivers,
+            "debug": self.debug,
+        }
+
+    def copy(self) -> "ChaosResult":
+        """Independent copy; drivers and the debug block are rebuilt."""
+        return ChaosResult(
+            self.engine,
+            self.engine_version,
+            self.home_team,
+            self.away_team,
+            self.chaos_score,
+            self.chaos_flag,
+            list(self.drivers),
+            copy_containers(self.debug),
+        )
 
 
 class ChaosEngine:
@@ -82,6 +148,23 @@ class ChaosEngine:
         self.note_boost_per_tag = float(note_boost_per_tag)
         self.max_note_boost = float(max_note_boost)
 
+        # Built once; every debug block gets its own copy, so a caller
+        # editing result.debug["params"] can't alter later results.
+        self._debug_params: Dict[str, float] = {
+            "base_floor": self.base_floor,
+            "base_ceiling": self.base_ceiling,
+            "low_threshold": self.low_threshold,
+            "high_threshold": self.high_threshold,
+            "note_boost_per_tag": self.note_boost_per_tag,
+            "max_note_boost": self.max_note_boost,
+        }
+
+        # raw_hash is always 0..999, so the base score is a table lookup.
+        span = self.base_ceiling - self.base_floor
+        self._base_score_table: Tuple[float, ...] = tuple(
+            self.base_floor + span * (raw / 999.0) for raw in range(1000)
+        )
+
     # ------------------------------------------------------------
     # INTERNAL HELPERS
     # ------------------------------------------------------------
@@ -90,46 +173,7 @@ class ChaosEngine:
         """
         Deterministic hash from team code characters only.
         """
-        team_code = (team_code or "").upper().strip()
-        if not team_code:
-            return 0
-        return sum(ord(ch) for ch in team_code)
-
-    def _pair_hash(self, home_code: str, away_code: str) -> int:
-        """
-        Combined, order-sensitive hash for matchup pair.
-        """
-        h = self._team_hash(home_code)
-        a = self._team_hash(away_code)
-        # simple mixed hash
-        return (h * 31 + a * 17) % 1000  # 0..999
-
-    def _normalize_base_score(self, raw: int) -> float:
-        """
-        Map raw 0..999 into [base_floor, base_ceiling].
-        """
-        span = self.base_ceiling - self.base_floor
-        return self.base_floor + span * (raw / 999.0)
-
-    def _parse_notes(self, notes: Optional[str]) -> List[str]:
-        """
-        Notes can be a comma-separated string of chaos drivers,
-        e.g. 'injury_uncertainty, rotation_noise'.
-        We treat unknown tags as generic chaos drivers.
-        """
-        if not notes:
-            return []
-
-        if isinstance(notes, str):
-            raw_tags = [t.strip().lower() for t in notes.split(",")]
-        else:
-            # Very defensive: if someone passes a list, flatten it.
-            try:
-                raw_tags = [str(t).strip().lower() for t in notes]  # type: ignore
-            except Exception:
-                raw_tags = [str(notes).strip().lower()]
-
-        return [t for t in raw_tags if t]
+        return team_code_hash(team_code)
 
     def _note_boost(self, tags: List[str]) -> float:
         """
@@ -142,24 +186,38 @@ class ChaosEngine:
             boost = self.max_note_boost
         return boost
 
-    def _label_flag(self, score: float) -> str:
-        """
-        Convert numeric chaos_score into a flag.
-        """
-        if score < self.low_threshold:
-            return "LOW"
-        if score < self.high_threshold:
-            return "MEDIUM"
-        return "HIGH"
-
     # ------------------------------------------------------------
     # PUBLIC API
     # ------------------------------------------------------------
+    def parse_notes(self, notes: Optional[str]) -> List[str]:
+        """
+        Notes can be a comma-separated string of chaos drivers,
+        e.g. 'injury_uncertainty, rotation_noise'.
+        We treat unknown tags as generic chaos drivers.
+
+        Idempotent: parse_notes(parse_notes(x)) == parse_notes(x), so the
+        parsed tags can stand in for the notes (e.g. as a cache key).
+        """
+        if not notes:
+            return []
+
+        if isinstance(notes, str):
+            # one pass: lower the whole string, then strip + filter per tag
+            return [t for t in map(str.strip, notes.lower().split(",")) if t]
+
+        # Very defensive: if someone passes a list, flatten it.
+        try:
+            return [t for t in (str(x).strip().lower() for x in notes) if t]  # type: ignore
+        except Exception:
+            tag = str(notes).strip().lower()
+            return [tag] if tag else []
+
     def compute_chaos(
         self,
         home_team: str,
         away_team: str,
         notes: Optional[str] = None,
+        debug: bool = True,
     ) -> ChaosResult:
         """
         Compute chaos_score and chaos_flag for a given matchup.
@@ -169,6 +227,7 @@ class ChaosEngine:
         - away_team: away team code (e.g. 'DEN')
         - notes: optional comma-separated chaos tags
                  (e.g. 'injury_uncertainty, rotation_noise')
+        - debug: populate result.debug (left empty when False)
 
         Returns:
         - ChaosResult
@@ -176,20 +235,44 @@ class ChaosEngine:
         home_code = (home_team or "").upper().strip()
         away_code = (away_team or "").upper().strip()
 
-        raw_hash = self._pair_hash(home_code, away_code)
-        base_score = self._normalize_base_score(raw_hash)
+        home_hash = self._team_hash(home_code)
+        # self-match: reuse the home hash instead of hashing the same code twice
+        away_hash = home_hash if away_code == home_code else self._team_hash(away_code)
+
+        return self.compute_chaos_hashed(
+            home_code,
+            away_code,
+            home_hash,
+            away_hash,
+            self.parse_notes(notes),
+            debug,
+        )
 
-        tags = self._parse_notes(notes)
+    def compute_chaos_hashed(
+        self,
+        home_code: str,
+        away_code: str,
+        home_hash: int,
+        away_hash: int,
+        tags: List[str],
+        debug: bool = True,
+    ) -> ChaosResult:
+        """
+        compute_chaos for codes already normalized (upper, stripped) and
+        hashed with utils.team_code_hash, and notes already run through
+        parse_notes. IntegrationEngine does all three once per matchup.
+        """
+        raw_hash = _chaos_raw_hash(home_hash, away_hash)
         boost = self._note_boost(tags)
 
-        chaos_score = base_score + boost
-        # clamp to [0, 1]
-        if chaos_score < 0.0:
-            chaos_score = 0.0
-        elif chaos_score > 1.0:
-            chaos_score = 1.0
-
-        chaos_flag = self._label_flag(chaos_score)
+        base_score = self._base_score_table[raw_hash]
+        chaos_score, flag_id = _chaos_kernel(
+            base_score,
+            boost,
+            self.low_threshold,
+            self.high_threshold,
+        )
+        chaos_flag = _FLAGS[flag_id]
 
         drivers: List[str] = []
         if tags:
@@ -201,22 +284,15 @@ class ChaosEngine:
         else:
             drivers.append("stable_environment")
 
-        debug: Dict[str, Any] = {
+        debug_info: Dict[str, Any] = {
             "home_code": home_code,
             "away_code": away_code,
             "raw_hash": raw_hash,
             "base_score": base_score,
             "note_tags": tags,
             "note_boost": boost,
-            "params": {
-                "base_floor": self.base_floor,
-                "base_ceiling": self.base_ceiling,
-                "low_threshold": self.low_threshold,
-                "high_threshold": self.high_threshold,
-                "note_boost_per_tag": self.note_boost_per_tag,
-                "max_note_boost": self.max_note_boost,
-            },
-        }
+            "params": dict(self._debug_params),
+        } if debug else {}
 
         return ChaosResult(
             engine="chaos",
@@ -226,5 +302,103 @@ class ChaosEngine:
             chaos_score=chaos_score,
             chaos_flag=chaos_flag,
             drivers=drivers,
-            debug=debug,
+            debug=debug_info,
         )
+
+    def compute_chaos_batch(
+        self,
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+        notes: Optional[Sequence[Optional[str]]] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        Compute chaos for many matchups in one pass.
+
+        Column-oriented counterpart of compute_chaos: returns parallel lists
+        (home_team, away_team, raw_hash, chaos_score, chaos_flag) whose rows
+        match compute_chaos exactly. No per-matchup ChaosResult or debug
+        dict is built.
+
+        Parameters:
+        - home_teams / away_teams: equal-length sequences of team codes
+        - notes: optional per-matchup note strings (same length)
+        """
+        n = len(home_teams)
+        if len(away_teams) != n:
+            raise ValueError("home_teams and away_teams must have the same length.")
+        if notes is not None and len(notes) != n:
+            raise ValueError("notes must have the same length as home_teams.")
+
+        team_hash = self._team_hash
+        base_score_table = self._base_score_table
+        low = self.low_threshold
+        high = self.high_threshold
+
+        homes: List[str] = []
+        aways: List[str] = []
+        raw_hashes: List[int] = []
+        scores: List[float] = []
+        flags: List[str] = []
+
+        for i in range(n):
+            home_code = (home_teams[i] or "").upper().strip()
+            away_code = (away_teams[i] or "").upper().strip()
+
+            raw_hash = _chaos_raw_hash(team_hash(home_code), team_hash(away_code))
+            boost = 0.0 if notes is None else self._note_boost(self.parse_notes(notes[i]))
+            score, flag_id = _chaos_kernel(base_score_table[raw_hash], boost, low, high)
+
+            homes.append(home_code)
+            aways.append(away_code)
+            raw_hashes.append(raw_hash)
+            scores.append(score)
+            flags.append(_FLAGS[flag_id])
+
+        return {
+            "home_team": homes,
+            "away_team": aways,
+            "raw_hash": raw_hashes,
+            "chaos_score": scores,
+            "chaos_flag": flags,
+        }
+
+
+# ------------------------------------------------------------
+# MEMOIZED MATCHUP WRAPPER
+# ------------------------------------------------------------
+# Shared default-params engine; engines hold no per-call state.
+_DEFAULT_CHAOS_ENGINE = ChaosEngine()
+
+
+@functools.lru_cache(maxsize=MATCHUP_CACHE_SIZE)
+def _compute_chaos_cached(
+    home_code: str,
+    away_code: str,
+    tags: Tuple[str, ...],
+) -> Mapping[str, Any]:
+    # parse_notes is idempotent on already-parsed tags.
+    return deep_freeze(_DEFAULT_CHAOS_ENGINE.compute_chaos(home_code, away_code, tags).to_dict())
+
+
+def compute_chaos_matchup(
+    home_team: str,
+    away_team: str,
+    notes: Optional[str] = None,
+) -> Mapping[str, Any]:
+    """
+    Memoized compute_chaos with default engine params.
+
+    Returns a read-only view of ChaosResult.to_dict() (nested dicts are
+    MappingProxyType, lists are tuples) so cached results can be shared.
+    Use clear_chaos_matchup_cache() to reset.
+    """
+    home_code = (home_team or "").upper().strip()
+    away_code = (away_team or "").upper().strip()
+    # Key on the parsed tags, so any notes compute_chaos accepts can be cached.
+    tags = tuple(_DEFAULT_CHAOS_ENGINE.parse_notes(notes))
+    return _compute_chaos_cached(home_code, away_code, tags)
+
+
+def clear_chaos_matchup_cache() -> None:
+    """Drop every memoized compute_chaos_matchup result."""
+    _compute_chaos_cached.cache_clear()
@@ -20,14 +20,53 @@ Notes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
+import functools
+from dataclasses import dataclass
+from typing import Dict, Any, List, Mapping, Sequence, Tuple
+
+from .utils import MATCHUP_CACHE_SIZE, copy_containers, deep_freeze, team_code_hash
 
 
 ENGINE_VERSION = "3.4-identity"
 
 
-@dataclass
+def _pace_row(bucket: int, base_total_anchor: float, max_pace_adjust: float) -> Tuple[float, float, float]:
+    """
+    (pace_factor, pace_offset, base_total) for a pace bucket 0..30.
+    """
+    # pace_factor in [0.85, 1.15]
+    pace_factor = 0.85 + 0.30 * (bucket / 30.0)
+
+    # Total anchored on base_total_anchor with pace adjustment
+    pace_offset = (pace_factor - 1.0) * max_pace_adjust
+    base_total = round(base_total_anchor + pace_offset, 1)
+    return pace_factor, pace_offset, base_total
+
+
+def _identity_kernel(
+    home_hash: int,
+    away_hash: int,
+    power_scale: float,
+    pace_table: Tuple[Tuple[float, float, float], ...],
+) -> Tuple[float, float, float, float, float]:
+    """
+    Pure numeric core shared by compute_identity and compute_identity_batch.
+
+    Returns (pace_factor, power_diff, pace_offset, base_spread, base_total).
+    pace_table holds the 31 _pace_row values, so the pace/total half is a
+    lookup.
+    """
+    pace_factor, pace_offset, base_total = pace_table[(home_hash + away_hash) % 31]
+    # positive -> home team stronger, negative -> away team stronger
+    power_diff = (home_hash - away_hash) / power_scale
+
+    # Home - away spread; negative means our model leans to the away side.
+    base_spread = round(-power_diff, 1)
+
+    return pace_factor, power_diff, pace_offset, base_spread, base_total
+
+
+@dataclass(slots=True)
 class IdentityResult:
     engine: str
     engine_version: str
@@ -40,7 +79,30 @@ class IdentityResult:
     debug: Dict[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "engine": self.engine,
+            "engine_version": self.engine_version,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "pace_factor": self.pace_factor,
+            "power_diff": self.power_diff,
+            "base_spread": self.base_spread,
+            "base_total": self.base_total,
+            "debug": self.debug,
+        }
+
+    def copy(self) -> "IdentityResult":
+        return IdentityResult(
+            self.engine,
+            self.engine_version,
+            self.home_team,
+            self.away_team,
+            self.pace_factor,
+            self.power_diff,
+            self.base_spread,
+            self.base_total,
+            copy_containers(self.debug),
+        )
 
 
 class IdentityEngine:
@@ -51,6 +113,9 @@ class IdentityEngine:
         engine = IdentityEngine()
         result = engine.compute_identity("HOR", "DEN")
         # result is an IdentityResult, or use result.to_dict()
+
+        batch = engine.compute_identity_batch(["HOR", "NYK"], ["DEN", "DET"])
+        # batch["base_spread"], batch["base_total"] (parallel lists)
     """
 
     def __init__(
@@ -69,6 +134,17 @@ class IdentityEngine:
         self.max_pace_adjust = float(max_pace_adjust)
         self.power_scale = float(power_scale)
 
+        self._debug_params: Dict[str, float] = {
+            "base_total_anchor": self.base_total_anchor,
+            "max_pace_adjust": self.max_pace_adjust,
+            "power_scale": self.power_scale,
+        }
+
+        # (home_hash + away_hash) % 31 has only 31 values; precompute pace/total.
+        self._pace_table: Tuple[Tuple[float, float, float], ...] = tuple(
+            _pace_row(bucket, self.base_total_anchor, self.max_pace_adjust) for bucket in range(31)
+        )
+
     # ------------------------------------------------------------
     # INTERNAL HELPERS
     # ------------------------------------------------------------
@@ -78,35 +154,12 @@ class IdentityEngine:
         Simple deterministic hash based only on team code characters.
         Keeps us fully self-contained and non-random.
         """
-        team_code = (team_code or "").upper().strip()
-        if not team_code:
-            return 0
-        return sum(ord(ch) for ch in team_code)
-
-    def _compute_pace_factor(self, home_hash: int, away_hash: int) -> float:
-        """
-        Derive a pseudo pace factor from the pair of team hashes.
-        Output is roughly in [0.85, 1.15] but deterministic.
-        """
-        raw = (home_hash + away_hash) % 31  # 0..30
-        normalized = raw / 30.0  # 0..1
-        # Map into [0.85, 1.15]
-        return 0.85 + 0.30 * normalized
-
-    def _compute_power_diff(self, home_hash: int, away_hash: int) -> float:
-        """
-        Derive a pseudo power_diff signal from the team hashes.
-
-        Positive power_diff  -> home team stronger
-        Negative power_diff  -> away team stronger
-        """
-        diff = home_hash - away_hash
-        return diff / self.power_scale
+        return team_code_hash(team_code)
 
     # ------------------------------------------------------------
     # PUBLIC API
     # ------------------------------------------------------------
-    def compute_identity(self, home_team: str, away_team: str) -> IdentityResult:
+    def compute_identity(self, home_team: str, away_team: str, debug: bool = True) -> IdentityResult:
         """
         Core entry point for the Identity Engine.
 
@@ -115,36 +168,43 @@ class IdentityEngine:
         - power_diff
         - base_spread  (home - away)
         - base_total
-        - debug dict
+        - debug dict (empty when debug=False)
         """
         home_team_code = (home_team or "").upper().strip()
         away_team_code = (away_team or "").upper().strip()
 
         home_hash = self._team_hash(home_team_code)
-        away_hash = self._team_hash(away_team_code)
+        away_hash = home_hash if away_team_code == home_team_code else self._team_hash(away_team_code)
 
-        pace_factor = self._compute_pace_factor(home_hash, away_hash)
-        power_diff = self._compute_power_diff(home_hash, away_hash)
+        return self.compute_identity_hashed(home_team_code, away_team_code, home_hash, away_hash, debug)
 
-        # Home - away spread; negative means our model leans to the away side.
-        base_spread = round(-power_diff, 1)
-
-        # Total anchored on base_total_anchor with pace adjustment
-        pace_offset = (pace_factor - 1.0) * self.max_pace_adjust
-        base_total = round(self.base_total_anchor + pace_offset, 1)
+    def compute_identity_hashed(
+        self,
+        home_team_code: str,
+        away_team_code: str,
+        home_hash: int,
+        away_hash: int,
+        debug: bool = True,
+    ) -> IdentityResult:
+        """
+        compute_identity for codes already normalized (upper, stripped) and
+        hashed with utils.team_code_hash.
+        """
+        pace_factor, power_diff, pace_offset, base_spread, base_total = _identity_kernel(
+            home_hash,
+            away_hash,
+            self.power_scale,
+            self._pace_table,
+        )
 
-        debug: Dict[str, Any] = {
+        debug_info: Dict[str, Any] = {
             "home_team_code": home_team_code,
             "away_team_code": away_team_code,
             "home_hash": home_hash,
             "away_hash": away_hash,
             "pace_offset": pace_offset,
-            "params": {
-                "base_total_anchor": self.base_total_anchor,
-                "max_pace_adjust": self.max_pace_adjust,
-                "power_scale": self.power_scale,
-            },
-        }
+            "params": dict(self._debug_params),
+        } if debug else {}
 
         return IdentityResult(
             engine="identity",
@@ -155,5 +215,87 @@ class IdentityEngine:
             power_diff=power_diff,
             base_spread=base_spread,
             base_total=base_total,
-            debug=debug,
+            debug=debug_info,
         )
+
+    def compute_identity_batch(
+        self,
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """
+        Compute identity lines for many matchups in one pass.
+
+        Column-oriented counterpart of compute_identity: returns parallel
+        lists (home_team, away_team, pace_factor, power_diff, base_spread,
+        base_total) whose rows match compute_identity exactly. No
+        per-matchup IdentityResult or debug dict is built.
+        """
+        n = len(home_teams)
+        if len(away_teams) != n:
+            raise ValueError("home_teams and away_teams must have the same length.")
+
+        team_hash = self._team_hash
+        power_scale = self.power_scale
+        pace_table = self._pace_table
+
+        homes: List[str] = []
+        aways: List[str] = []
+        pace_factors: List[float] = []
+        power_diffs: List[float] = []
+        spreads: List[float] = []
+        totals: List[float] = []
+
+        for i in range(n):
+            home_code = (home_teams[i] or "").upper().strip()
+            away_code = (away_teams[i] or "").upper().strip()
+            pace_factor, power_diff, _, base_spread, base_total = _identity_kernel(
+                team_hash(home_code),
+                team_hash(away_code),
+                power_scale,
+                pace_table,
+            )
+
+            homes.append(home_code)
+            aways.append(away_code)
+            pace_factors.append(pace_factor)
+            power_diffs.append(power_diff)
+            spreads.append(base_spread)
+            totals.append(base_total)
+
+        return {
+            "home_team": homes,
+            "away_team": aways,
+            "pace_factor": pace_factors,
+            "power_diff": power_diffs,
+            "base_spread": spreads,
+            "base_total": totals,
+        }
+
+
+# ------------------------------------------------------------
+# MEMOIZED MATCHUP WRAPPER
+# ------------------------------------------------------------
+_DEFAULT_IDENTITY_ENGINE = IdentityEngine()
+
+
+@functools.lru_cache(maxsize=MATCHUP_CACHE_SIZE)
+def _compute_identity_cached(home_code: str, away_code: str) -> Mapping[str, Any]:
+    return deep_freeze(_DEFAULT_IDENTITY_ENGINE.compute_identity(home_code, away_code).to_dict())
+
+
+def compute_identity_matchup(home_team: str, away_team: str) -> Mapping[str, Any]:
+    """
+    Memoized compute_identity with default engine params.
+
+    Returns a read-only view of IdentityResult.to_dict() so cached results
+    can be shared. Use clear_identity_matchup_cache() to reset.
+    """
+    home_code = (home_team or "").upper().strip()
+    away_code = (away_team or "").upper().strip()
+    return _compute_identity_cached(home_code, away_code)
+
+
+def clear_identity_matchup_cache() -> None:
+    """Drop every memoized compute_identity_matchup result."""
+    _compute_identity_cached.cache_clear()
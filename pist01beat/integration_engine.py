@@ -8,14 +8,25 @@ This engine:
 - Bundles outputs into a single integrated_state dict
 
 Pist01Beat.predict() uses IntegrationEngine.run()
+
+Engine results are memoized per matchup, so repeated predictions for
+the same (home, away, notes) skip all engine work; callers always get
+their own copies of the cached results.
 """
 
-from typing import Dict, Any, Optional
+import sys
+import threading
+from typing import Dict, Any, Optional, Tuple
 
 from .identity_engine import IdentityEngine
 from .chaos_engine import ChaosEngine
 from .volatility_engine import VolatilityEngine
 from .spread_engine import SpreadEngine
+from .utils import team_code_hash
+
+
+# (home_team, away_team, parsed note tags) -> (identity, chaos, volatility, spread)
+_ResultsKey = Tuple[str, str, Tuple[str, ...]]
 
 
 class IntegrationEngine:
@@ -23,21 +34,45 @@ class IntegrationEngine:
 
     ENGINE_VERSION: str = "3.4-integration-v1-spread"
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = 4096, debug: bool = False) -> None:
+        """
+        Parameters:
+        - cache_size: max matchups whose engine results are memoized
+          (0 disables caching). Engine results are deterministic in
+          (home_team, away_team, notes); call clear_cache() after
+          swapping or reconfiguring a sub-engine.
+        - debug: ask identity / chaos / volatility / spread to fill
+          their result.debug blocks. Off by default (the blocks are then
+          empty dicts); nothing on the prediction path reads them. Fixed
+          for the instance's lifetime, since cached results depend on it.
+        """
+        self._debug = bool(debug)
         self.identity_engine = IdentityEngine()
         self.chaos_engine = ChaosEngine()
         self.volatility_engine = VolatilityEngine()
         self.spread_engine = SpreadEngine()  # NEW
 
-    def compute_state(
-        self,
-        home_team: str,
-        away_team: str,
-        notes: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """
-        Compute the unified model state for a single matchup.
-        """
+        # Plain dict, oldest entry evicted first (dicts keep insertion order).
+        # It holds only results, so the engine never references itself.
+        self._cache_size = max(0, int(cache_size))
+        self._result_cache: Dict[_ResultsKey, Tuple[Any, Any, Any, Any]] = {}
+        self._cache_lock = threading.Lock()
+
+    @property
+    def debug(self) -> bool:
+        """Whether engine results carry debug blocks (read-only)."""
+        return self._debug
+
+    def clear_cache(self) -> None:
+        """Drop all memoized engine results."""
+        with self._cache_lock:
+            self._result_cache.clear()
+
+    # ------------------------------------------------------------
+    # INTERNAL HELPERS
+    # ------------------------------------------------------------
+    @staticmethod
+    def _normalize_teams(home_team: str, away_team: str) -> Tuple[str, str]:
         home_team = home_team.strip().upper()
         away_team = away_team.strip().upper()
 
@@ -47,23 +82,83 @@ class IntegrationEngine:
         if home_team == away_team:
             raise ValueError("home_team and away_team must be different teams.")
 
-        identity_result = self.identity_engine.compute_identity(
-            home_team=home_team,
-            away_team=away_team,
+        # The same few codes recur in every state / cache key; share one object each.
+        return sys.intern(home_team), sys.intern(away_team)
+
+    def _results(self, home_team: str, away_team: str, notes: Optional[str]) -> Tuple[Any, Any, Any, Any]:
+        # Key on the parsed tags: any notes input parse_notes accepts works,
+        # and equivalent notes ("a, b" / ["a", "b"]) share one entry.
+        tags = tuple(self.chaos_engine.parse_notes(notes))
+        key = (home_team, away_team, tags)
+        cached = self._result_cache.get(key)
+        if cached is None:
+            cached = self._compute_results(home_team, away_team, tags)
+            if self._cache_size:
+                with self._cache_lock:
+                    if len(self._result_cache) >= self._cache_size:
+                        del self._result_cache[next(iter(self._result_cache))]
+                    self._result_cache[key] = cached
+        identity, chaos, volatility, spread = cached
+        # Cached results are never handed out; each call gets its own objects.
+        return identity.copy(), chaos.copy(), volatility.copy(), spread.copy()
+
+    def _compute_results(self, home_team: str, away_team: str, tags: Tuple[str, ...]) -> Tuple[Any, Any, Any, Any]:
+        """
+        Run identity, chaos, volatility and spread for normalized codes
+        and parsed note tags. Memoized per instance by _results.
+
+        Codes are hashed once here and handed to the engines' *_hashed
+        entry points, which skip their own normalization and hashing.
+        """
+        # All engines share the same team-code hash.
+        home_hash = team_code_hash(home_team)
+        away_hash = team_code_hash(away_team)
+
+        identity_result = self.identity_engine.compute_identity_hashed(
+            home_team,
+            away_team,
+            home_hash,
+            away_hash,
+            self._debug,
         )
 
-        chaos_result = self.chaos_engine.compute_chaos(
-            home_team=home_team,
-            away_team=away_team,
-            notes=notes,
+        chaos_result = self.chaos_engine.compute_chaos_hashed(
+            home_team,
+            away_team,
+            home_hash,
+            away_hash,
+            list(tags),
+            self._debug,
+        )
+
+        volatility_result = self.volatility_engine.compute_volatility_hashed(
+            home_team,
+            away_team,
+            home_hash,
+            away_hash,
+            self._debug,
         )
 
-        volatility_result = self.volatility_engine.compute_volatility(
+        spread_result = self.spread_engine.compute_lines(
             home_team=home_team,
             away_team=away_team,
+            identity=identity_result,
+            chaos=chaos_result,
+            volatility=volatility_result,
+            debug=self._debug,
         )
 
-        integrated_state: Dict[str, Any] = {
+        return identity_result, chaos_result, volatility_result, spread_result
+
+    def _build_state(
+        self,
+        home_team: str,
+        away_team: str,
+        identity_result: Any,
+        chaos_result: Any,
+        volatility_result: Any,
+    ) -> Dict[str, Any]:
+        return {
             "engine_version": self.ENGINE_VERSION,
             "home_team": home_team,
             "away_team": away_team,
@@ -77,7 +172,21 @@ class IntegrationEngine:
             },
         }
 
-        return integrated_state
+    # ------------------------------------------------------------
+    # PUBLIC API
+    # ------------------------------------------------------------
+    def compute_state(
+        self,
+        home_team: str,
+        away_team: str,
+        notes: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compute the unified model state for a single matchup.
+        """
+        home_team, away_team = self._normalize_teams(home_team, away_team)
+        identity_result, chaos_result, volatility_result, _ = self._results(home_team, away_team, notes)
+        return self._build_state(home_team, away_team, identity_result, chaos_result, volatility_result)
 
     def run(
         self,
@@ -89,24 +198,32 @@ class IntegrationEngine:
         v1-spread:
         - Compute unified state (identity, chaos, volatility)
         - Call SpreadEngine to attach model_spread + model_total
-        """
-        state = self.compute_state(
-            home_team=home_team,
-            away_team=away_team,
-            notes=notes,
-        )
 
-        identity = state["identity"]
-        chaos = state["chaos"]
-        volatility = state["volatility"]
-
-        spread_result = self.spread_engine.compute_lines(
-            home_team=state["home_team"],
-            away_team=state["away_team"],
-            identity=identity,
-            chaos=chaos,
-            volatility=volatility,
-        )
+        Engine results are memoized per (home_team, away_team, notes);
+        the returned dict and result objects are fresh copies on every call.
+        """
+        home_team, away_team = self._normalize_teams(home_team, away_team)
+        identity, chaos, volatility, spread_result = self._results(home_team, away_team, notes)
 
+        state = self._build_state(home_team, away_team, identity, chaos, volatility)
         state["spread"] = spread_result
         return state
+
+
+# ------------------------------------------------------------
+# SHARED DEFAULT ENGINE
+# ------------------------------------------------------------
+_DEFAULT_ENGINE: Optional[IntegrationEngine] = None
+
+
+def get_default_engine() -> IntegrationEngine:
+    """
+    Process-wide default-params IntegrationEngine, built on first use.
+
+    Pist01Beat() reuses it unless given an engine, so repeated wrapper
+    construction skips sub-engine setup and shares one result cache.
+    """
+    global _DEFAULT_ENGINE
+    if _DEFAULT_ENGINE is None:
+        _DEFAULT_ENGINE = IntegrationEngine()
+    return _DEFAULT_ENGINE
@@ -12,19 +12,25 @@ predict() normalizes that into stable spread/total lines and
 never hard-crashes; errors are surfaced in debug.
 """
 
-from dataclasses import asdict, is_dataclass
-from typing import Any, Dict
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, List, Optional, Sequence
 import traceback
 
-from .integration_engine import IntegrationEngine
+from .integration_engine import IntegrationEngine, get_default_engine
 
 
 class Pist01Beat:
     """High-level Pist01 Beat v3.4 wrapper."""
 
-    def __init__(self) -> None:
-        # Single orchestration layer that runs the full pipeline
-        self.integration = IntegrationEngine()
+    # Spread-result key prefixes a line is read from, in priority order.
+    # SpreadLines carries model_<kind>; final_ / base_ are fallbacks for
+    # other spread producers.
+    _LINE_KEY_PREFIXES = ("model_", "final_", "base_")
+
+    def __init__(self, engine: Optional[IntegrationEngine] = None) -> None:
+        # Single orchestration layer that runs the full pipeline; the
+        # process-wide default engine is shared unless one is passed in.
+        self.integration = engine if engine is not None else get_default_engine()
 
     # ----------------------------
     # Helpers
@@ -42,7 +48,9 @@ class Pist01Beat:
             return obj
 
         if is_dataclass(obj):
-            return asdict(obj)
+            # Shallow field read; asdict() would deepcopy nested debug blocks
+            # that predict() only reads from.
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
 
         out: Dict[str, Any] = {}
         for name in dir(obj):
@@ -54,6 +62,37 @@ class Pist01Beat:
                 continue
         return out
 
+    @classmethod
+    def _line_key(cls, spread_dict: Dict[str, Any], kind: str) -> Optional[str]:
+        """
+        First <prefix><kind> key (kind: "spread" / "total") present in a
+        spread result dict or column dict, or None.
+        """
+        for prefix in cls._LINE_KEY_PREFIXES:
+            key = prefix + kind
+            if key in spread_dict:
+                return key
+        return None
+
+    @classmethod
+    def _pick_line(cls, spread_dict: Dict[str, Any], kind: str) -> float:
+        """
+        Read a line from a spread result dict. Missing or None -> 0.0.
+        """
+        key = cls._line_key(spread_dict, kind)
+        value = None if key is None else spread_dict[key]
+        return 0.0 if value is None else value
+
+    @classmethod
+    def _pick_line_column(cls, columns: Dict[str, List[Any]], kind: str, n: int) -> List[float]:
+        """
+        Column counterpart of _pick_line, for predict_batch.
+        """
+        key = cls._line_key(columns, kind)
+        if key is None:
+            return [0.0] * n
+        return [0.0 if value is None else value for value in columns[key]]
+
     # ----------------------------
     # Public API
     # ----------------------------
@@ -96,24 +135,8 @@ class Pist01Beat:
 
             spread_dict = self._to_dict(spread_obj)
 
-            # Choose correct spread attributes
-            model_spread = (
-                spread_dict.get("final_spread")
-                if "final_spread" in spread_dict
-                else spread_dict.get("base_spread")
-            )
-
-            model_total = (
-                spread_dict.get("final_total")
-                if "final_total" in spread_dict
-                else spread_dict.get("base_total")
-            )
-
-            # Final safety defaults
-            if model_spread is None:
-                model_spread = 0.0
-            if model_total is None:
-                model_total = 0.0
+            model_spread = self._pick_line(spread_dict, "spread")
+            model_total = self._pick_line(spread_dict, "total")
 
             return {
                 "engine_version": engine_version,
@@ -143,3 +166,74 @@ class Pist01Beat:
                     "traceback": traceback.format_exc(),
                 },
             }
+
+    def predict_batch(
+        self,
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """
+        Score many matchups in one pass (e.g. a full slate or schedule).
+
+        Returns parallel lists:
+
+        {
+            "home_team": [...],     # as passed in, like predict()
+            "away_team": [...],
+            "model_spread": [...],
+            "model_total": [...],
+            "chaos_score": [...],
+            "chaos_flag": [...],
+        }
+
+        Lines match predict() for the same matchup: both read them through
+        _line_key, predict() from SpreadLines and this from the
+        compute_lines_batch columns. Matchups predict() rejects (empty or
+        identical team codes) get its 0.0 / 0.0 fallback lines and None chaos.
+        Built on the engines' column batch paths, so no per-matchup result
+        objects or debug dicts are created.
+        """
+        integration = self.integration
+        identity = integration.identity_engine.compute_identity_batch(home_teams, away_teams)
+        chaos = integration.chaos_engine.compute_chaos_batch(home_teams, away_teams)
+        lines = integration.spread_engine.compute_lines_batch(
+            identity["home_team"],
+            identity["away_team"],
+            identity,
+            chaos,
+        )
+
+        spreads: List[float] = []
+        totals: List[float] = []
+        chaos_scores: List[Optional[float]] = []
+        chaos_flags: List[Optional[str]] = []
+
+        n = len(identity["home_team"])
+        rows = zip(
+            identity["home_team"],
+            identity["away_team"],
+            self._pick_line_column(lines, "spread", n),
+            self._pick_line_column(lines, "total", n),
+            chaos["chaos_score"],
+            chaos["chaos_flag"],
+        )
+        for home_code, away_code, spread, total, chaos_score, chaos_flag in rows:
+            if home_code and away_code and home_code != away_code:
+                spreads.append(spread)
+                totals.append(total)
+                chaos_scores.append(chaos_score)
+                chaos_flags.append(chaos_flag)
+            else:
+                spreads.append(0.0)
+                totals.append(0.0)
+                chaos_scores.append(None)
+                chaos_flags.append(None)
+
+        return {
+            "home_team": list(home_teams),
+            "away_team": list(away_teams),
+            "model_spread": spreads,
+            "model_total": totals,
+            "chaos_score": chaos_scores,
+            "chaos_flag": chaos_flags,
+        }
@@ -11,18 +11,28 @@ import argparse
 import json
 from typing import Any, Dict, List, Optional
 
+from pist01beat.ops.json_deterministic import dumps, dumps_bytes
+
 
 DIFF_CLI_VERSION = "diff_cli_v1_readonly"
 
+# best-effort tool imports, resolved once (missing tools become warnings)
+try:
+    from pist01beat.ops.export_diff import diff_exports as _export_diff  # type: ignore
+except Exception:
+    _export_diff = None
 
-def _json_dumps_deterministic(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+try:
+    from pist01beat.ops.diff_summary import summarize_diff as _diff_summary  # type: ignore
+except Exception:
+    _diff_summary = None
 
 
 def _read_json(path: str) -> Optional[dict]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # json.loads decodes UTF-8 bytes itself; skips the text-layer decode.
+        with open(path, "rb") as f:
+            return json.loads(f.read())
     except Exception:
         return None
 
@@ -42,19 +52,12 @@ def diff_exports(a_path: str, b_path: str) -> dict:
     """
     warnings: List[str] = []
 
-    export_diff = None
-    diff_summary = None
+    export_diff = _export_diff
+    diff_summary = _diff_summary
 
-    try:
-        from pist01beat.ops.export_diff import diff_exports as _de  # type: ignore
-        export_diff = _de
-    except Exception:
+    if export_diff is None:
         warnings.append("missing_export_diff")
-
-    try:
-        from pist01beat.ops.diff_summary import summarize_diff as _sd  # type: ignore
-        diff_summary = _sd
-    except Exception:
+    if diff_summary is None:
         warnings.append("missing_diff_summary")
 
     a = _read_json(a_path)
@@ -118,12 +121,15 @@ def main(argv: Optional[List[str]] = None) -> int:
             "has_diff": bool(res.get("diff")),
             "version": res.get("version"),
         }
-        print(_json_dumps_deterministic(short))
+        print(dumps(short))
 
     if args.write:
-        payload = _json_dumps_deterministic(res)
-        with open(args.write, "w", encoding="utf-8") as f:
-            f.write(payload + "\n")
+        # Write UTF-8 bytes directly; skips the payload + "\n" copy and the
+        # text layer's second encode pass.
+        payload = dumps_bytes(res)
+        with open(args.write, "wb") as f:
+            f.write(payload)
+            f.write(b"\n")
 
     return 0 if res.get("ok") else 1
 
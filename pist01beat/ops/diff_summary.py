@@ -28,24 +28,26 @@ def summarize_diff(diff: Dict[str, Any], max_paths: int = 25) -> Dict[str, Any]:
     changed = diff.get("changed") or {}
     added = diff.get("added") or {}
     removed = diff.get("removed") or {}
-    warns = diff.get("warnings") or []
+    warns = list(diff.get("warnings") or [])
 
     if not isinstance(changed, dict):
         changed = {}
-        warns = list(warns) + ["diff.changed is not a dict"]
+        warns.append("diff.changed is not a dict")
     if not isinstance(added, dict):
         added = {}
-        warns = list(warns) + ["diff.added is not a dict"]
+        warns.append("diff.added is not a dict")
     if not isinstance(removed, dict):
         removed = {}
-        warns = list(warns) + ["diff.removed is not a dict"]
+        warns.append("diff.removed is not a dict")
 
-    c_paths = sorted([str(k) for k in changed.keys()])[: max(0, int(max_paths))]
-    a_paths = sorted([str(k) for k in added.keys()])[: max(0, int(max_paths))]
-    r_paths = sorted([str(k) for k in removed.keys()])[: max(0, int(max_paths))]
+    limit = max(0, int(max_paths))
+    c_paths = sorted(str(k) for k in changed)[:limit]
+    a_paths = sorted(str(k) for k in added)[:limit]
+    r_paths = sorted(str(k) for k in removed)[:limit]
 
-    counts = {"changed": len(changed), "added": len(added), "removed": len(removed)}
-    headline = _headline(counts)
+    n_changed, n_added, n_removed = len(changed), len(added), len(removed)
+    counts = {"changed": n_changed, "added": n_added, "removed": n_removed}
+    headline = _headline_fast(n_changed, n_added, n_removed)
 
     return {
         "version": DIFF_SUMMARY_VERSION,
@@ -54,7 +56,7 @@ def summarize_diff(diff: Dict[str, Any], max_paths: int = 25) -> Dict[str, Any]:
         "changed_paths": c_paths,
         "added_paths": a_paths,
         "removed_paths": r_paths,
-        "warnings": sorted(set([str(w) for w in warns])),
+        "warnings": sorted({str(w) for w in warns}),
     }
 
 
@@ -62,8 +64,12 @@ def _headline(counts: Dict[str, Any]) -> str:
     c = int(counts.get("changed", 0) or 0)
     a = int(counts.get("added", 0) or 0)
     r = int(counts.get("removed", 0) or 0)
+    return _headline_fast(c, a, r)
 
-    if c == 0 and a == 0 and r == 0:
+
+def _headline_fast(c: int, a: int, r: int) -> str:
+    # Counts already known to be ints (summarize_diff); skips the coercion.
+    if not (c or a or r):
         return "No differences"
     parts: List[str] = []
     if c:
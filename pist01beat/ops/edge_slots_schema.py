@@ -14,14 +14,17 @@ HB15 constraints:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional
 
 
 EDGE_SLOTS_SCHEMA_VERSION = "0.1.0"
 
-_ALLOWED_BET_TYPES = {"ML", "SPREAD", "GAME_TOTAL", "TEAM_TOTAL", "1H", "PROP"}
-_ALLOWED_CONF = {"B+", "A-", "A", "A+", "A++"}
-_ALLOWED_EDGE_TYPES = {"DIRECTION", "SCORING", "TEMPO", "ROLE", "OTHER"}
+_ALLOWED_BET_TYPES: FrozenSet[str] = frozenset({"ML", "SPREAD", "GAME_TOTAL", "TEAM_TOTAL", "1H", "PROP"})
+_ALLOWED_CONF: FrozenSet[str] = frozenset({"B+", "A-", "A", "A+", "A++"})
+_ALLOWED_EDGE_TYPES: FrozenSet[str] = frozenset({"DIRECTION", "SCORING", "TEMPO", "ROLE", "OTHER"})
+
+_SLOT_KEY = itemgetter("slot")
 
 
 def _require_str(d: Dict[str, Any], key: str) -> str:
@@ -100,51 +103,92 @@ def validate_edge_slots(payload: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("'edges' must be a non-empty list")
 
     seen_slots = set()
-    norm_edges: List[Dict[str, Any]] = []
+    # Sized up front and filled by index (every slot is set or we raise).
+    norm_edges: List[Optional[Dict[str, Any]]] = [None] * len(edges)
 
     for i, e in enumerate(edges):
         if not isinstance(e, dict):
             raise ValueError(f"edges[{i}] must be a dict")
 
-        slot = _require_int(e, "slot")
+        # Inlined _require_* checks: one e.get per key, no helper frames.
+        # Check order (and so the first error raised) matches the helpers.
+        get = e.get
+
+        slot = get("slot")
+        if not isinstance(slot, int):
+            raise ValueError("'slot' must be an int")
         if slot <= 0 or slot in seen_slots:
             raise ValueError(f"invalid or duplicate slot '{slot}'")
         seen_slots.add(slot)
 
-        bet_type = _require_str(e, "bet_type").upper()
+        bet_type = get("bet_type")
+        if not isinstance(bet_type, str) or not bet_type.strip():
+            raise ValueError("'bet_type' must be a non-empty string")
+        bet_type = bet_type.strip().upper()
         if bet_type not in _ALLOWED_BET_TYPES:
             raise ValueError(f"invalid bet_type '{bet_type}'")
 
-        confidence = _require_str(e, "confidence").upper()
+        confidence = get("confidence")
+        if not isinstance(confidence, str) or not confidence.strip():
+            raise ValueError("'confidence' must be a non-empty string")
+        confidence = confidence.strip().upper()
         if confidence not in _ALLOWED_CONF:
             raise ValueError(f"invalid confidence '{confidence}'")
 
-        edge_type = _require_str(e, "edge_type").upper()
+        edge_type = get("edge_type")
+        if not isinstance(edge_type, str) or not edge_type.strip():
+            raise ValueError("'edge_type' must be a non-empty string")
+        edge_type = edge_type.strip().upper()
         if edge_type not in _ALLOWED_EDGE_TYPES:
             raise ValueError(f"invalid edge_type '{edge_type}'")
 
-        loss_paths = e.get("kill_switch_loss_paths")
-        if (
-            not isinstance(loss_paths, list)
-            or len(loss_paths) != 3
-            or not all(isinstance(x, str) and x.strip() for x in loss_paths)
+        loss_paths = get("kill_switch_loss_paths")
+        if not isinstance(loss_paths, list) or len(loss_paths) != 3:
+            raise ValueError("kill_switch_loss_paths must be 3 non-empty strings")
+        lp0, lp1, lp2 = loss_paths
+        if not (
+            isinstance(lp0, str) and lp0.strip()
+            and isinstance(lp1, str) and lp1.strip()
+            and isinstance(lp2, str) and lp2.strip()
         ):
             raise ValueError("kill_switch_loss_paths must be 3 non-empty strings")
 
-        norm_edges.append({
+        line = get("line")
+        if not isinstance(line, str) or not line.strip():
+            raise ValueError("'line' must be a non-empty string")
+
+        book = get("book")
+        if not isinstance(book, str) or not book.strip():
+            raise ValueError("'book' must be a non-empty string")
+
+        why = get("why")
+        if not isinstance(why, str) or not why.strip():
+            raise ValueError("'why' must be a non-empty string")
+
+        auto_kills_passed = get("auto_kills_passed")
+        if not isinstance(auto_kills_passed, bool):
+            raise ValueError("'auto_kills_passed' must be a boolean")
+
+        notes = get("notes", "")
+        if notes is None:
+            notes = ""
+        elif not isinstance(notes, str):
+            raise ValueError("'notes' must be a string if provided")
+
+        norm_edges[i] = {
             "slot": slot,
             "bet_type": bet_type,
-            "line": _require_str(e, "line"),
-            "book": _require_str(e, "book"),
+            "line": line.strip(),
+            "book": book.strip(),
             "confidence": confidence,
             "edge_type": edge_type,
-            "why": _require_str(e, "why"),
-            "auto_kills_passed": _require_bool(e, "auto_kills_passed"),
-            "kill_switch_loss_paths": [x.strip() for x in loss_paths],
-            "notes": _optional_str(e, "notes"),
-        })
+            "why": why.strip(),
+            "auto_kills_passed": auto_kills_passed,
+            "kill_switch_loss_paths": [lp0.strip(), lp1.strip(), lp2.strip()],
+            "notes": notes.strip(),
+        }
 
-    norm_edges.sort(key=lambda x: x["slot"])
+    norm_edges.sort(key=_SLOT_KEY)
 
     return {
         "version": EDGE_SLOTS_SCHEMA_VERSION,
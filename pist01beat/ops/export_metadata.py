@@ -1,45 +1,53 @@
 from __future__ import annotations
 
-import hashlib
-import json
 import platform as _platform
 import sys
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+from pist01beat.ops.json_deterministic import sha256_hex
 
-EXPORT_METADATA_VERSION = "export_metadata_v1_readonly"
-
-
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
+EXPORT_METADATA_VERSION = "export_metadata_v1_readonly"
 
-def _deterministic_json_bytes(obj: Any) -> bytes:
-    s = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return s.encode("utf-8")
+# Fixed for the process lifetime; platform() can cost milliseconds per call.
+_PY_VERSION = sys.version.split(" ", 1)[0]
+_PLATFORM = _platform.platform()
 
 
-def _sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def attach_export_metadata(export_obj: Dict[str, Any]) -> Dict[str, Any]:
+def _attach(export_obj: Dict[str, Any], created_utc: str) -> Dict[str, Any]:
     if not isinstance(export_obj, dict):
         raise TypeError("attach_export_metadata expects export_obj to be a dict")
 
-    payload_bytes = _deterministic_json_bytes(export_obj)
-    payload_hash = _sha256_hex(payload_bytes)
+    payload_hash = sha256_hex(export_obj)
 
     export_version = export_obj.get("version", "unknown")
 
     metadata = {
         "export_version": export_version,
         "metadata_version": EXPORT_METADATA_VERSION,
-        "created_utc": _utc_now_iso(),
-        "python_version": sys.version.split(" ")[0],
-        "platform": _platform.platform(),
+        "created_utc": created_utc,
+        "python_version": _PY_VERSION,
+        "platform": _PLATFORM,
         "payload_hash": payload_hash,
     }
 
     return {"metadata": metadata, "payload": export_obj}
+
+
+def attach_export_metadata(export_obj: Dict[str, Any]) -> Dict[str, Any]:
+    return _attach(export_obj, _utc_now_iso())
+
+
+def attach_export_metadata_batch(export_objs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    attach_export_metadata for a batch (e.g. an end-of-day audit run).
+    The clock is read once, so every export in the batch shares one
+    created_utc; each payload_hash is still computed per export.
+    """
+    created_utc = _utc_now_iso()
+    return [_attach(export_obj, created_utc) for export_obj in export_objs]
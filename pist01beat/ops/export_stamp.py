@@ -24,7 +24,7 @@ def build_export_stamp(export: Dict[str, Any]) -> Dict[str, Any]:
     if export_version is not None and not isinstance(export_version, str):
         export_version = str(export_version)
 
-    created_at_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    created_at_utc = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
     export_hash = hash_export(export if isinstance(export, dict) else {"_root": export})
 
     out: Dict[str, Any] = {}
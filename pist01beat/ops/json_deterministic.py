@@ -7,12 +7,16 @@ Infrastructure-only. No engine imports.
 
 from __future__ import annotations
 
+import hashlib
 import json
 from typing import Any
 
 
 JSON_DETERMINISTIC_VERSION = "json_deterministic_v1_readonly"
 
+# Shared encoder: json.dumps() with these kwargs builds a new JSONEncoder per call.
+_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
 
 def dumps(obj: Any) -> str:
     """
@@ -21,12 +25,64 @@ def dumps(obj: Any) -> str:
     - Stable key ordering (sort_keys=True)
     - Stable separators ("," ":")
     """
-    return json.dumps(
-        obj,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    )
+    return _ENCODER.encode(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    dumps(obj) encoded as UTF-8 bytes (the form that gets hashed).
+    """
+    return _ENCODER.encode(obj).encode("utf-8")
+
+
+def sha256_hex(obj: Any) -> str:
+    """
+    SHA-256 hex digest of dumps_bytes(obj).
+
+    Content fingerprint, not a security boundary. hashlib's OpenSSL-backed
+    sha256 already uses SHA-NI where the CPU has it; keep OpenSSL linked.
+    """
+    return hashlib.sha256(dumps_bytes(obj), usedforsecurity=False).hexdigest()
+
+
+def sha256_hex_streamed(obj: Any, chunk_items: int = 1024) -> str:
+    """
+    sha256_hex(obj) without materializing the whole JSON text.
+
+    dict levels are written key by key; lists longer than chunk_items are
+    encoded chunk_items elements at a time. Peak memory is one chunk's
+    JSON rather than the whole payload's (and its UTF-8 copy). Digest is
+    identical to sha256_hex(obj).
+    """
+    h = hashlib.sha256(usedforsecurity=False)
+    _stream_update(h, obj, chunk_items)
+    return h.hexdigest()
+
+
+def _stream_update(h: Any, obj: Any, chunk_items: int) -> None:
+    encode = _ENCODER.encode
+    # Non-str keys are coerced and sorted by json itself; keep those whole.
+    if isinstance(obj, dict) and all(type(k) is str for k in obj):
+        h.update(b"{")
+        first = True
+        for k in sorted(obj):
+            if not first:
+                h.update(b",")
+            first = False
+            h.update(encode(k).encode("utf-8"))
+            h.update(b":")
+            _stream_update(h, obj[k], chunk_items)
+        h.update(b"}")
+    elif isinstance(obj, list) and len(obj) > chunk_items:
+        h.update(b"[")
+        for i in range(0, len(obj), chunk_items):
+            if i:
+                h.update(b",")
+            # encode() of the slice is "[...]"; keep only the elements.
+            h.update(encode(obj[i:i + chunk_items])[1:-1].encode("utf-8"))
+        h.update(b"]")
+    else:
+        h.update(encode(obj).encode("utf-8"))
 
 
 def dump_to_path(obj: Any, path: str) -> None:
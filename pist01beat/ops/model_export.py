@@ -1,20 +1,11 @@
 from __future__ import annotations
 
-import hashlib
-import json
 from typing import Any, Dict, List
 
+from pist01beat.ops.json_deterministic import sha256_hex
 
-MODEL_EXPORT_VERSION = "model_export_v1_readonly"
-
-
-def _deterministic_json_bytes(obj: Any) -> bytes:
-    s = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return s.encode("utf-8")
 
-
-def _sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+MODEL_EXPORT_VERSION = "model_export_v1_readonly"
 
 
 def build_model_export() -> Dict[str, Any]:
@@ -29,5 +20,5 @@ def build_model_export() -> Dict[str, Any]:
         "team_pack_audit": {"available": False, "summary": None},
     }
 
-    payload["decision_hash"] = _sha256_hex(_deterministic_json_bytes(payload))
+    payload["decision_hash"] = sha256_hex(payload)
     return payload
@@ -10,10 +10,43 @@ Goal:
 
 from __future__ import annotations
 
+import functools
 from typing import Dict, List, Optional, Tuple
 
 OPS_INDEX_VERSION = "ops_index_v1_readonly"
 
+# (key, module, attr_version_name), pre-sorted by key so the tools list
+# comes out in deterministic order without a per-call sort.
+_TARGETS: Tuple[Tuple[str, str, str], ...] = tuple(
+    sorted(
+        (
+            ("repo_snapshot", "pist01beat.ops.repo_snapshot", "REPO_SNAPSHOT_VERSION"),
+            ("repo_snapshot_cli", "pist01beat.ops.repo_snapshot_cli", "REPO_SNAPSHOT_CLI_VERSION"),
+            ("preflight_cli", "pist01beat.ops.preflight_cli", "PREFLIGHT_CLI_VERSION"),
+            ("ops_dispatch", "pist01beat.ops.__main__", "OPS_DISPATCH_VERSION"),
+            ("ops_index", "pist01beat.ops.ops_index", "OPS_INDEX_VERSION"),
+        ),
+        key=lambda t: t[0],
+    )
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_version(mod_name: str, ver_attr: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Returns (version_val, warning) for one target. Memoized: a module's
+    version constant (or its import failure) is fixed for the process.
+    """
+    try:
+        mod = __import__(mod_name, fromlist=[ver_attr])
+    except Exception as e:
+        return None, f"import_failed: {mod_name}: {type(e).__name__}"
+
+    version_val = getattr(mod, ver_attr, None)
+    if version_val is None:
+        return None, f"missing_version_attr: {mod_name}.{ver_attr}"
+    return version_val, None
+
 
 def build_ops_index() -> Dict:
     """
@@ -27,24 +60,10 @@ def build_ops_index() -> Dict:
 
     tools: List[Dict[str, Optional[str]]] = []
 
-    # (key, module, attr_version_name)
-    targets: List[Tuple[str, str, str]] = [
-        ("repo_snapshot", "pist01beat.ops.repo_snapshot", "REPO_SNAPSHOT_VERSION"),
-        ("repo_snapshot_cli", "pist01beat.ops.repo_snapshot_cli", "REPO_SNAPSHOT_CLI_VERSION"),
-        ("preflight_cli", "pist01beat.ops.preflight_cli", "PREFLIGHT_CLI_VERSION"),
-        ("ops_dispatch", "pist01beat.ops.__main__", "OPS_DISPATCH_VERSION"),
-        ("ops_index", "pist01beat.ops.ops_index", "OPS_INDEX_VERSION"),
-    ]
-
-    for key, mod_name, ver_attr in targets:
-        version_val: Optional[str] = None
-        try:
-            mod = __import__(mod_name, fromlist=[ver_attr])
-            version_val = getattr(mod, ver_attr, None)
-            if version_val is None:
-                warnings.append(f"missing_version_attr: {mod_name}.{ver_attr}")
-        except Exception as e:
-            warnings.append(f"import_failed: {mod_name}: {type(e).__name__}")
+    for key, mod_name, ver_attr in _TARGETS:
+        version_val, warning = _resolve_version(mod_name, ver_attr)
+        if warning is not None:
+            warnings.append(warning)
 
         tools.append(
             {
@@ -55,8 +74,7 @@ def build_ops_index() -> Dict:
             }
         )
 
-    # Deterministic ordering
-    tools.sort(key=lambda x: (x.get("key") or ""))
+    # Deterministic ordering: _TARGETS is already sorted by key.
 
     return {
         "version": OPS_INDEX_VERSION,
@@ -13,6 +13,7 @@ import argparse
 import json
 from typing import List, Optional
 
+from pist01beat.ops.json_deterministic import dumps as _dumps_compact
 from pist01beat.ops.ops_index import build_ops_index
 
 OPS_INDEX_CLI_VERSION = "ops_index_cli_v1_readonly"
@@ -43,7 +44,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         if args.pretty:
             print(json.dumps(idx, sort_keys=True, indent=2, ensure_ascii=False))
         else:
-            print(json.dumps(idx, sort_keys=True, separators=(",", ":"), ensure_ascii=False))
+            print(_dumps_compact(idx))
         return 0
 
     n_tools = len(idx.get("tools", []) or [])
@@ -1,8 +1,11 @@
+import functools
 import pkgutil
-from typing import List
+from typing import List, Tuple
 
 
-def list_ops_modules() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def _ops_module_names() -> Tuple[str, ...]:
+    # The ops package's files don't change within a process; scan once.
     import pist01beat.ops as ops_pkg
 
     names = []
@@ -10,7 +13,11 @@ def list_ops_modules() -> List[str]:
         if m.name.startswith("_"):
             continue
         names.append(m.name)
-    return sorted(names)
+    return tuple(sorted(names))
+
+
+def list_ops_modules() -> List[str]:
+    return list(_ops_module_names())
 
 
 def main() -> None:
@@ -10,6 +10,8 @@ Goal:
 Checks:
 - repo_snapshot: can build snapshot + fingerprint
 - preflight: can build report + fingerprint present
+  (file bytes are re-read by default, so the fingerprints are an
+  independent cross-check; --reuse-hashes skips that)
 - ops_index: can build index + has tools
 """
 
@@ -33,6 +35,12 @@ def _build_parser() -> argparse.ArgumentParser:
     p.add_argument("--repo-root", default=None, help="Repo root path. Default: auto-detect from CWD.")
     p.add_argument("--max-file-mb", type=int, default=25, help="Skip files larger than this size (MB). Default: 25.")
     p.add_argument("--follow-symlinks", action="store_true", help="Follow symlinks during walk (default: false).")
+    p.add_argument(
+        "--reuse-hashes",
+        action="store_true",
+        help="Let the preflight fingerprint reuse the snapshot's in-process file hashes "
+        "(faster, but it no longer re-reads file bytes; default: off).",
+    )
     p.add_argument("--version", action="store_true", help="Print CLI version and exit.")
     return p
 
@@ -50,6 +58,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         repo_root=args.repo_root,
         max_file_mb=int(args.max_file_mb),
         follow_symlinks=bool(args.follow_symlinks),
+        use_hash_cache=bool(args.reuse_hashes),
     )
     fp = snap.get("repo_fingerprint_sha256")
     if not isinstance(fp, str) or len(fp) < 12:
@@ -66,6 +75,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         follow_symlinks=bool(args.follow_symlinks),
         exclude_dir=None,
         exclude_file=None,
+        use_hash_cache=bool(args.reuse_hashes),
     )
     pfp = pre.get("repo_fingerprint_sha256")
     if pfp != fp:
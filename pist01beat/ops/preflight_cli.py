@@ -15,20 +15,22 @@ Outputs:
 - file count, warnings count
 - git HEAD (best-effort; warn-only if unavailable)
 
-No writes. Prints to stdout only.
+No writes (unless --hash-cache is given). Prints to stdout only.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import platform
+import string
 import subprocess
 import sys
 from typing import Dict, List, Optional
 
 import pist01beat
-from pist01beat.ops.repo_snapshot import build_repo_snapshot
+from pist01beat.ops.repo_snapshot import DEFAULT_HASH_CACHE_FILE, build_repo_snapshot
 
 PREFLIGHT_CLI_VERSION = "preflight_cli_v1_readonly"
 
@@ -43,12 +45,95 @@ def _build_parser() -> argparse.ArgumentParser:
     p.add_argument("--follow-symlinks", action="store_true", help="Follow symlinks during walk (default: false).")
     p.add_argument("--exclude-dir", action="append", default=[], help="Additional dir basename excludes (repeatable).")
     p.add_argument("--exclude-file", action="append", default=[], help="Additional file basename excludes (repeatable).")
+    p.add_argument(
+        "--hash-cache",
+        nargs="?",
+        const=DEFAULT_HASH_CACHE_FILE,
+        default=None,
+        metavar="PATH",
+        help="Reuse file hashes while (path, size, mtime_ns) is unchanged, via an on-disk cache "
+        f"(default PATH: {DEFAULT_HASH_CACHE_FILE}). Off by default: every file is re-hashed.",
+    )
     p.add_argument("--json", action="store_true", help="Print full JSON report (default prints one-line summary).")
     p.add_argument("--pretty", action="store_true", help="Pretty-print JSON (only with --json).")
     p.add_argument("--version", action="store_true", help="Print CLI version and exit.")
     return p
 
 
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _is_object_id(value: Optional[str]) -> bool:
+    # sha1 (40) or sha256 (64) object id
+    return value is not None and len(value) in (40, 64) and _HEX_DIGITS.issuperset(value)
+
+
+def _read_git_head_from_files(start: str) -> Optional[str]:
+    """
+    Resolve HEAD like `git rev-parse HEAD` by reading .git directly
+    (HEAD -> loose ref -> packed-refs), without spawning git.
+
+    Returns None whenever the layout is anything but the plain files case
+    (no .git found, reftable, unexpected contents); callers then run git.
+    """
+    cur = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(cur, ".git")
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+            break
+        if os.path.isfile(dot_git):
+            # worktree / submodule: ".git" file holding "gitdir: <path>"
+            text = _read_text(dot_git)
+            if not text or not text.startswith("gitdir:"):
+                return None
+            git_dir = os.path.join(cur, text[len("gitdir:"):].strip())
+            break
+        parent = os.path.dirname(cur)
+        if parent == cur:
+            return None
+        cur = parent
+
+    head = _read_text(os.path.join(git_dir, "HEAD"))
+    if head is None:
+        return None
+    if _is_object_id(head):
+        return head  # detached HEAD
+    if not head.startswith("ref: "):
+        return None
+    ref = head[len("ref: "):].strip()
+    if not ref.startswith("refs/"):
+        return None
+
+    # Worktrees keep shared refs in the common dir.
+    common = _read_text(os.path.join(git_dir, "commondir"))
+    common_dir = os.path.join(git_dir, common) if common else git_dir
+
+    for base in (git_dir, common_dir):
+        value = _read_text(os.path.join(base, *ref.split("/")))
+        if value is not None:
+            return value if _is_object_id(value) else None
+
+    packed = _read_text(os.path.join(common_dir, "packed-refs"))
+    if packed is None:
+        return None
+    for line in packed.splitlines():
+        if not line or line[0] in "#^":
+            continue
+        oid, _, name = line.partition(" ")
+        if name == ref:
+            return oid if _is_object_id(oid) else None
+    return None
+
+
 def _best_effort_git_head() -> Dict[str, Optional[str]]:
     """
     Read-only git head info.
@@ -58,13 +143,19 @@ def _best_effort_git_head() -> Dict[str, Optional[str]]:
       - git_error: str|None
     """
     out: Dict[str, Optional[str]] = {"git_head": None, "git_is_dirty": None, "git_error": None}
-    try:
-        head = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+    # Plain .git layouts resolve from files; git is only spawned for the rest.
+    head = _read_git_head_from_files(os.getcwd())
+    if head is not None:
         out["git_head"] = head
-    except Exception as e:
-        out["git_error"] = f"git_head_unavailable: {type(e).__name__}"
-        return out
-
+    else:
+        try:
+            head = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+            out["git_head"] = head
+        except Exception as e:
+            out["git_error"] = f"git_head_unavailable: {type(e).__name__}"
+            return out
+
+    # Always asked of git: working-tree edits don't touch any file under .git.
     try:
         status = subprocess.check_output(["git", "status", "--porcelain"], text=True)
         out["git_is_dirty"] = bool(status.strip())
@@ -80,6 +171,8 @@ def build_preflight_report(
     follow_symlinks: bool,
     exclude_dir: Optional[List[str]],
     exclude_file: Optional[List[str]],
+    use_hash_cache: bool = False,
+    hash_cache_file: Optional[str] = None,
 ) -> Dict:
     warnings: List[str] = []
 
@@ -90,6 +183,8 @@ def build_preflight_report(
         excluded_files=exclude_file if exclude_file else None,
         max_file_mb=max_file_mb,
         follow_symlinks=follow_symlinks,
+        use_hash_cache=use_hash_cache,
+        hash_cache_file=hash_cache_file,
     )
 
     git_info = _best_effort_git_head()
@@ -131,6 +226,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         follow_symlinks=bool(args.follow_symlinks),
         exclude_dir=args.exclude_dir if args.exclude_dir else None,
         exclude_file=args.exclude_file if args.exclude_file else None,
+        use_hash_cache=args.hash_cache is not None,
+        hash_cache_file=args.hash_cache,
     )
 
     if args.json:
@@ -9,7 +9,8 @@ This file has ZERO decision authority.
 
 FILE_VERSION = "repo_guardrails_v1_readonly"
 
-from typing import Dict, List
+import sys
+from typing import Dict, List, Optional
 
 BASKETBALL_KEYWORDS = {
     "nba", "basketball", "points", "rebounds", "assists",
@@ -18,29 +19,69 @@ BASKETBALL_KEYWORDS = {
     "offense", "defense", "player", "coach", "matchup",
 }
 
+# Sorted once, so hits come out in order without a per-call set + sort.
+_SORTED_KEYWORDS = tuple(sorted(BASKETBALL_KEYWORDS))
+
 def scan_text_for_basketball(text: str) -> List[str]:
     if not isinstance(text, str):
         return []
     lower = text.lower()
-    hits = {kw for kw in BASKETBALL_KEYWORDS if kw in lower}
-    return sorted(hits)
+    return [kw for kw in _SORTED_KEYWORDS if kw in lower]
+
+def scan_object(obj, max_findings: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    Map JSONPath-ish locations ("$.a[0].b") of strings with keyword hits to
+    their hits, in depth-first document order.
 
-def scan_object(obj) -> Dict[str, List[str]]:
+    Iterative (a stack of child iterators), so deep payloads don't recurse;
+    a location string is only built for a string that actually has hits.
+    max_findings: stop once that many locations are found (callers that only
+    need a yes/no can pass 1).
+    """
     findings: Dict[str, List[str]] = {}
 
-    def _scan(node, path: str) -> None:
-        if isinstance(node, str):
-            hits = scan_text_for_basketball(node)
-            if hits:
-                findings[path] = hits
-        elif isinstance(node, dict):
-            for k, v in node.items():
-                _scan(v, f"{path}.{k}")
-        elif isinstance(node, list):
-            for i, v in enumerate(node):
-                _scan(v, f"{path}[{i}]")
-
-    _scan(obj, "$")
+    if isinstance(obj, str):
+        hits = scan_text_for_basketball(obj)
+        if hits:
+            findings["$"] = hits
+        return findings
+
+    if isinstance(obj, dict):
+        stack = [(iter(obj.items()), "$", False)]
+    elif isinstance(obj, list):
+        stack = [(enumerate(obj), "$", True)]
+    else:
+        return findings
+
+    # Cyclic input raised RecursionError when this recursed; keep that
+    # rather than looping forever.
+    max_depth = sys.getrecursionlimit()
+
+    while stack:
+        children, path, is_list = stack[-1]
+        for k, v in children:
+            if isinstance(v, str):
+                if not v:
+                    continue
+                hits = scan_text_for_basketball(v)
+                if hits:
+                    findings[f"{path}[{k}]" if is_list else f"{path}.{k}"] = hits
+                    if max_findings is not None and len(findings) >= max_findings:
+                        return findings
+            elif isinstance(v, dict):
+                child = (iter(v.items()), f"{path}[{k}]" if is_list else f"{path}.{k}", False)
+                break
+            elif isinstance(v, list):
+                child = (enumerate(v), f"{path}[{k}]" if is_list else f"{path}.{k}", True)
+                break
+        else:
+            stack.pop()
+            continue
+
+        if len(stack) >= max_depth:
+            raise RecursionError("scan_object: payload nested too deeply (cyclic?)")
+        stack.append(child)
+
     return findings
 
 def guardrail_check(payload) -> Dict[str, object]:
@@ -7,31 +7,133 @@ Deterministic, read-only repo snapshot manifest.
 - Stable ordering
 - Streamed sha256 hashing
 - Deterministic repo fingerprint (excludes created_at_utc)
+- Every file re-hashed by default; opt-in reuse per (path, size, mtime_ns)
 """
 
 from __future__ import annotations
 
+import concurrent.futures as _futures
 import datetime as _dt
 import hashlib as _hashlib
 import json as _json
 import os as _os
+from operator import attrgetter as _attrgetter, itemgetter as _itemgetter
 from pathlib import Path as _Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from pist01beat.ops.json_deterministic import sha256_hex_streamed
 
 REPO_SNAPSHOT_VERSION = "repo_snapshot_v1_readonly"
 
+_ENTRY_NAME = _attrgetter("name")
+_ROW_PATH = _itemgetter("path")
+
+_file_digest = getattr(_hashlib, "file_digest", None)
+_HAS_FADVISE = hasattr(_os, "posix_fadvise")
+
+# Files at least this big are hashed on the worker pool (hashlib releases the
+# GIL while hashing them); smaller ones are cheaper to hash inline than to
+# hand off. A repo with no such file never starts a pool.
+_PARALLEL_HASH_MIN_BYTES = 256 * 1024
+_DEFAULT_HASH_WORKERS = min(8, _os.cpu_count() or 1)
+
+# Read size for streamed hashing without hashlib.file_digest.
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+_FILE_FLAGS = _os.O_RDONLY | getattr(_os, "O_BINARY", 0)
+_DIR_FLAGS = _os.O_RDONLY | getattr(_os, "O_DIRECTORY", 0)
+
+# POSIX: scan directories by fd and open entries relative to it (openat /
+# fstatat, as os.fwalk does), so the kernel never re-resolves the full path.
+# Elsewhere, fall back to path strings.
+_USE_DIR_FD = (
+    _os.scandir in _os.supports_fd
+    and _os.open in _os.supports_dir_fd
+    and _os.stat in _os.supports_dir_fd
+)
+
+
+# In-process memo of file hashes, keyed "<abs path>|<size>|<mtime_ns>".
+# Only consulted with use_hash_cache=True: a same-size rewrite that keeps
+# the mtime would otherwise be reported with its old hash.
+_HASH_MEMO: Dict[str, str] = {}
+_HASH_MEMO_MAX = 65536
+
+HASH_CACHE_VERSION = "repo_snapshot_hash_cache_v1"
+DEFAULT_HASH_CACHE_FILE = _os.path.join("~", ".cache", "pist01beat", "snapshot_cache.json")
+
+
+def _load_hash_cache(path: str) -> Dict[str, str]:
+    """Best-effort read; a missing, unreadable or foreign cache is empty."""
+    try:
+        with open(path, "rb") as f:
+            data = _json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != HASH_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {k: v for k, v in entries.items() if isinstance(k, str) and isinstance(v, str)}
+
+
+def _save_hash_cache(path: str, entries: Dict[str, str]) -> None:
+    """Best-effort atomic write (temp file + os.replace); failures are ignored."""
+    tmp = f"{path}.{_os.getpid()}.tmp"
+    try:
+        _os.makedirs(_os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(_json_normalize({"version": HASH_CACHE_VERSION, "entries": entries}))
+        _os.replace(tmp, path)
+    except OSError:
+        try:
+            _os.remove(tmp)
+        except OSError:
+            pass
+
 
 def _utc_now_iso() -> str:
-    return _dt.datetime.now(tz=_dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return _dt.datetime.now(tz=_dt.timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
 def _json_normalize(obj: dict) -> str:
     return _json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
-def _sha256_file(path: _Path, chunk_bytes: int = 1024 * 1024) -> str:
-    h = _hashlib.sha256()
-    with path.open("rb") as f:
+def _prefetch_rest(fd: int, offset: int) -> None:
+    """Ask the kernel to start reading the rest of the file in the background."""
+    try:
+        _os.posix_fadvise(fd, offset, 0, _os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
+def _sha256_file(path: str, chunk_bytes: int = _HASH_CHUNK_BYTES, dir_fd: Optional[int] = None) -> str:
+    # Unbuffered: every read below is already large or exact-sized.
+    with _os.fdopen(_os.open(path, _FILE_FLAGS, dir_fd=dir_fd), "rb", buffering=0) as f:
+        size = _os.fstat(f.fileno()).st_size
+
+        if _file_digest is not None and size >= chunk_bytes:
+            # Bigger file: file_digest (3.11+) streams it through a reused
+            # buffer, with the kernel reading ahead of it.
+            if _HAS_FADVISE:
+                _prefetch_rest(f.fileno(), 0)
+            return _file_digest(f, "sha256").hexdigest()
+
+        h = _hashlib.sha256()
+        # Sized from fstat (size + 1 sees EOF in the same call), so a small
+        # file is one exact read instead of a chunk_bytes buffer + EOF read.
+        want = min(size + 1, chunk_bytes)
+        b = f.read(want)
+        h.update(b)
+        if len(b) < want:
+            return h.hexdigest()
+
+        # Bigger file: the remaining reads overlap with hashing the first chunk.
+        if _HAS_FADVISE:
+            _prefetch_rest(f.fileno(), len(b))
+
         while True:
             b = f.read(chunk_bytes)
             if not b:
@@ -59,7 +161,23 @@ def build_repo_snapshot(
     excluded_files: Optional[List[str]] = None,
     max_file_mb: int = 25,
     follow_symlinks: bool = False,
+    hash_workers: Optional[int] = None,
+    use_hash_cache: bool = False,
+    hash_cache_file: Optional[str] = None,
 ) -> Dict:
+    """
+    hash_workers: threads used to hash large files (default min(8, cpu_count));
+    1 hashes everything serially. Output does not depend on it.
+
+    use_hash_cache: opt-in; reuse a file's hash while its (path, size,
+    mtime_ns) is unchanged, from the in-process memo or hash_cache_file.
+    This trusts metadata over bytes. Default False re-hashes every file.
+
+    hash_cache_file: opt-in on-disk cache (JSON), read before the walk and
+    rewritten atomically after it when entries changed. Entries for files no
+    longer in this repo's snapshot are dropped on rewrite. Without it,
+    nothing is written.
+    """
     warnings: List[str] = []
 
     start = _Path(repo_root).expanduser().resolve() if repo_root else _Path.cwd().resolve()
@@ -69,13 +187,9 @@ def build_repo_snapshot(
     default_ex_dirs = [".git", "__pycache__", ".ipynb_checkpoints", "exports"]
     default_ex_files: List[str] = []
 
-    ex_dirs: Set[str] = set(default_ex_dirs)
-    ex_files: Set[str] = set(default_ex_files)
-
-    if excluded_dirs:
-        ex_dirs.update(excluded_dirs)
-    if excluded_files:
-        ex_files.update(excluded_files)
+    # Frozen: membership is tested for every entry of the walk.
+    ex_dirs: FrozenSet[str] = frozenset(default_ex_dirs).union(excluded_dirs or ())
+    ex_files: FrozenSet[str] = frozenset(default_ex_files).union(excluded_files or ())
 
     max_bytes = int(max_file_mb) * 1024 * 1024
 
@@ -83,45 +197,190 @@ def build_repo_snapshot(
     skipped_files: List[str] = []
     skipped_dirs: List[str] = []
 
-    for dirpath, dirnames, filenames in _os.walk(root, topdown=True, followlinks=follow_symlinks):
-        dirpath_p = _Path(dirpath)
+    workers = _DEFAULT_HASH_WORKERS if hash_workers is None else max(1, int(hash_workers))
+    pool: Optional[_futures.ThreadPoolExecutor] = None
+
+    key_prefix = root.as_posix().rstrip("/") + "/"
+    disk_cache: Dict[str, str] = {}
+    if use_hash_cache and hash_cache_file:
+        hash_cache_file = _os.path.expanduser(hash_cache_file)
+        disk_cache = _load_hash_cache(hash_cache_file)
+    # key -> sha256 for every file hashed or reused in this snapshot.
+    seen: Dict[str, str] = {}
+
+    # Per-entry lookups, bound once for the walk (closure cells, not globals).
+    memo_get = _HASH_MEMO.get
+    disk_get = disk_cache.get
+    use_dir_fd = _USE_DIR_FD
+    sha256_file = _sha256_file
+    parallel_min = _PARALLEL_HASH_MIN_BYTES if workers > 1 else None
+    # (st_dev, st_ino) of the directories on the current walk path; only
+    # tracked when following symlinks, where a link back up would loop.
+    active_dirs: Set[Tuple[int, int]] = set()
+
+    # Depth-first walk over os.scandir, in the same order os.walk(topdown=True)
+    # visits with sorted names. DirEntry caches d_type and stat results, so
+    # each file costs one stat instead of separate lstat / stat / stat calls.
+    # dir_ref is an open directory fd when _USE_DIR_FD, else a path string.
+    def _scan(dir_ref, prefix: str) -> None:
+        nonlocal pool
+
+        try:
+            with _os.scandir(dir_ref) as it:
+                entries = sorted(it, key=_ENTRY_NAME)
+        except OSError:
+            return
+
+        subdirs: List[_os.DirEntry] = []
+        # (row, cache key, future) for files of this directory hashed on the pool.
+        pending: List[Tuple[Dict, str, _futures.Future]] = []
+
+        for entry in entries:
+            name = entry.name
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Pruned here, never scanned.
+                if name in ex_dirs:
+                    skipped_dirs.append(prefix + name)
+                elif follow_symlinks or not entry.is_symlink():
+                    subdirs.append(entry)
+                continue
 
-        kept_dirs: List[str] = []
-        for d in dirnames:
-            if d in ex_dirs:
-                skipped_dirs.append((dirpath_p / d).relative_to(root).as_posix())
-            else:
-                kept_dirs.append(d)
-        dirnames[:] = sorted(kept_dirs)
+            relp = prefix + name
 
-        for fn in sorted(filenames):
-            if fn in ex_files:
-                skipped_files.append((dirpath_p / fn).relative_to(root).as_posix())
+            if name in ex_files:
+                skipped_files.append(relp)
                 continue
 
-            full = dirpath_p / fn
-
-            if full.is_symlink() and not follow_symlinks:
-                relp = full.relative_to(root).as_posix()
+            if entry.is_symlink() and not follow_symlinks:
                 skipped_files.append(relp)
                 warnings.append(f"skipped_symlink: {relp}")
                 continue
 
-            if not full.is_file():
-                skipped_files.append(full.relative_to(root).as_posix())
+            # Unreadable targets (ELOOP, EACCES, ...) are skipped like non-files.
+            try:
+                is_file = entry.is_file()
+                st = entry.stat() if is_file else None
+            except OSError:
+                is_file = False
+            if not is_file:
+                skipped_files.append(relp)
                 continue
 
-            size_bytes = int(full.stat().st_size)
+            size_bytes = int(st.st_size)
             if size_bytes > max_bytes:
-                relp = full.relative_to(root).as_posix()
                 skipped_files.append(relp)
                 warnings.append(f"skipped_huge_file: {relp}")
                 continue
 
-            sha = _sha256_file(full)
-            file_rows.append({"path": full.relative_to(root).as_posix(), "size_bytes": size_bytes, "sha256": sha})
+            if use_hash_cache:
+                key = f"{key_prefix}{relp}|{size_bytes}|{st.st_mtime_ns}"
+                sha = memo_get(key) or disk_get(key)
+                if sha is not None:
+                    seen[key] = sha
+                    file_rows.append({"path": relp, "size_bytes": size_bytes, "sha256": sha})
+                    continue
+            else:
+                key = ""
 
-    file_rows.sort(key=lambda r: r["path"])
+            if use_dir_fd:
+                hash_args = (name, _HASH_CHUNK_BYTES, dir_ref)
+            else:
+                hash_args = (entry.path,)
+
+            row = {"path": relp, "size_bytes": size_bytes, "sha256": ""}
+            file_rows.append(row)
+
+            if parallel_min is not None and size_bytes >= parallel_min:
+                if pool is None:
+                    pool = _futures.ThreadPoolExecutor(max_workers=workers)
+                pending.append((row, key, pool.submit(sha256_file, *hash_args)))
+            else:
+                row["sha256"] = sha = sha256_file(*hash_args)
+                if use_hash_cache:
+                    seen[key] = sha
+
+        # Subtrees are walked while this directory's files hash. dir_ref must
+        # stay open until they finish, so always wait before returning.
+        try:
+            for entry in subdirs:
+                sub_prefix = prefix + entry.name + "/"
+                dir_key = None
+                if follow_symlinks:
+                    try:
+                        st_dir = entry.stat()
+                    except OSError:
+                        continue
+                    dir_key = (st_dir.st_dev, st_dir.st_ino)
+                    if dir_key in active_dirs:
+                        warnings.append(f"skipped_symlink_loop: {prefix}{entry.name}")
+                        continue
+                    active_dirs.add(dir_key)
+                try:
+                    if not use_dir_fd:
+                        _scan(entry.path, sub_prefix)
+                        continue
+                    try:
+                        sub_fd = _os.open(entry.name, _DIR_FLAGS, dir_fd=dir_ref)
+                    except OSError:
+                        continue
+                    try:
+                        _scan(sub_fd, sub_prefix)
+                    finally:
+                        _os.close(sub_fd)
+                finally:
+                    if dir_key is not None:
+                        active_dirs.discard(dir_key)
+        finally:
+            if pending:
+                _futures.wait([fut for _, _, fut in pending])
+
+        for row, key, fut in pending:
+            row["sha256"] = sha = fut.result()
+            if use_hash_cache:
+                seen[key] = sha
+
+    if follow_symlinks:
+        try:
+            st_root = _os.stat(str(root))
+            active_dirs.add((st_root.st_dev, st_root.st_ino))
+        except OSError:
+            pass
+
+    try:
+        if _USE_DIR_FD:
+            root_fd = _os.open(str(root), _DIR_FLAGS)
+            try:
+                _scan(root_fd, "")
+            finally:
+                _os.close(root_fd)
+        else:
+            _scan(str(root), "")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if use_hash_cache:
+        if len(_HASH_MEMO) + len(seen) > _HASH_MEMO_MAX:
+            _HASH_MEMO.clear()
+        _HASH_MEMO.update(seen)
+
+        if hash_cache_file:
+            # Keep other repos' entries; this repo's are replaced by this walk.
+            merged = {k: v for k, v in disk_cache.items() if not k.startswith(key_prefix)}
+            merged.update(seen)
+            if merged != disk_cache:
+                _save_hash_cache(hash_cache_file, merged)
+
+    # The walk's per-directory name sort is kept: warnings are emitted in
+    # walk order and are part of the fingerprint. Rows arrive nearly sorted,
+    # so this is close to a linear pass.
+    file_rows.sort(key=_ROW_PATH)
 
     snapshot: Dict = {
         "version": REPO_SNAPSHOT_VERSION,
@@ -136,8 +395,8 @@ def build_repo_snapshot(
     fingerprint_payload = dict(snapshot)
     fingerprint_payload.pop("created_at_utc", None)
 
-    normalized = _json_normalize(fingerprint_payload)
-    snapshot["repo_fingerprint_sha256"] = _hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    # Same digest as sha256 over _json_normalize(), streamed row-chunk by row-chunk.
+    snapshot["repo_fingerprint_sha256"] = sha256_hex_streamed(fingerprint_payload)
 
     snapshot["excluded_dirs_detected"] = sorted(set(skipped_dirs))
     snapshot["excluded_files_detected"] = sorted(set(skipped_files))
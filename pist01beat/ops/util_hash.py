@@ -6,15 +6,17 @@ from typing import Sequence, Optional, Union, List
 BytesLike = Union[bytes, bytearray, memoryview]
 PathLike = Union[str, Path]
 
+_file_digest = getattr(hashlib, "file_digest", None)
+
 
 def sha256_bytes(data: BytesLike) -> str:
-    h = hashlib.sha256()
-    h.update(bytes(data))
-    return h.hexdigest()
+    # hashlib reads bytes / bytearray / memoryview through the buffer
+    # protocol; no bytes() copy needed.
+    return hashlib.sha256(data).hexdigest()
 
 
 def sha256_text(text: str, encoding: str = "utf-8", errors: str = "strict") -> str:
-    return sha256_bytes(text.encode(encoding, errors))
+    return hashlib.sha256(text.encode(encoding, errors)).hexdigest()
 
 
 def sha256_file(path: PathLike, chunk_size: int = 1024 * 1024) -> str:
@@ -22,8 +24,12 @@ def sha256_file(path: PathLike, chunk_size: int = 1024 * 1024) -> str:
     if chunk_size <= 0:
         raise ValueError("chunk_size must be > 0")
 
-    h = hashlib.sha256()
     with p.open("rb") as f:
+        if _file_digest is not None:
+            # file_digest (3.11+) streams through its own reused buffer;
+            # chunk_size only sizes the reads of the fallback loop.
+            return _file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         while True:
             chunk = f.read(chunk_size)
             if not chunk:
@@ -11,14 +11,16 @@ Logic:
 - Attaches chaos and volatility info only in debug for now.
 """
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .utils import copy_containers
 
 
 ENGINE_VERSION = "3.4-spread-minimal"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadLines:
     engine: str
     engine_version: str
@@ -29,7 +31,26 @@ class SpreadLines:
     debug: Dict[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "engine": self.engine,
+            "engine_version": self.engine_version,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "model_spread": self.model_spread,
+            "model_total": self.model_total,
+            "debug": self.debug,
+        }
+
+    def copy(self) -> "SpreadLines":
+        return SpreadLines(
+            self.engine,
+            self.engine_version,
+            self.home_team,
+            self.away_team,
+            self.model_spread,
+            self.model_total,
+            copy_containers(self.debug),
+        )
 
 
 class SpreadEngine:
@@ -48,6 +69,11 @@ class SpreadEngine:
         )
 
     For now, this just passes through identity.base_spread and identity.base_total.
+
+    Batch counterpart (columns from IdentityEngine.compute_identity_batch):
+
+        lines = engine.compute_lines_batch(homes, aways, identity_batch)
+        # lines["model_spread"], lines["model_total"] (parallel lists)
     """
 
     def compute_lines(
@@ -57,17 +83,21 @@ class SpreadEngine:
         identity: Any,
         chaos: Any,
         volatility: Any,
+        debug: bool = True,
     ) -> SpreadLines:
+        """
+        Spread / total lines for one matchup.
+        result.debug is left empty when debug=False.
+        """
         # Identity is expected to be either an IdentityResult dataclass
-        # or a dict-like object with base_spread/base_total attributes/keys.
-        base_spread = getattr(identity, "base_spread", None)
-        base_total = getattr(identity, "base_total", None)
-
-        # Fallback if identity is a dict instead of a dataclass
-        if base_spread is None and isinstance(identity, dict):
+        # or a dict with base_spread/base_total keys. Pick the accessor
+        # once instead of trying getattr then dict.get for each field.
+        if isinstance(identity, dict):
             base_spread = identity.get("base_spread")
-        if base_total is None and isinstance(identity, dict):
             base_total = identity.get("base_total")
+        else:
+            base_spread = getattr(identity, "base_spread", None)
+            base_total = getattr(identity, "base_total", None)
 
         if base_spread is None or base_total is None:
             raise ValueError(
@@ -75,11 +105,11 @@ class SpreadEngine:
                 "base_spread and base_total."
             )
 
-        debug: Dict[str, Any] = {
+        debug_info: Dict[str, Any] = {
             "identity_type": type(identity).__name__,
             "chaos_type": type(chaos).__name__,
             "volatility_type": type(volatility).__name__,
-        }
+        } if debug else {}
 
         return SpreadLines(
             engine="spread",
@@ -88,5 +118,44 @@ class SpreadEngine:
             away_team=away_team,
             model_spread=base_spread,
             model_total=base_total,
-            debug=debug,
+            debug=debug_info,
         )
+
+    def compute_lines_batch(
+        self,
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+        identity: Mapping[str, Sequence[float]],
+        chaos: Optional[Mapping[str, Sequence[Any]]] = None,
+        volatility: Optional[Mapping[str, Sequence[Any]]] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        Compute lines for many matchups in one pass.
+
+        Column-oriented counterpart of compute_lines: identity / chaos /
+        volatility are the column dicts of the engines' *_batch methods.
+        Returns parallel lists (home_team, away_team, model_spread,
+        model_total) whose rows match compute_lines exactly. No SpreadLines
+        or debug dict is built.
+        """
+        n = len(home_teams)
+        if len(away_teams) != n:
+            raise ValueError("home_teams and away_teams must have the same length.")
+
+        base_spreads = identity.get("base_spread")
+        base_totals = identity.get("base_total")
+        if base_spreads is None or base_totals is None:
+            raise ValueError(
+                "SpreadEngine.compute_lines_batch expected identity to provide "
+                "base_spread and base_total columns."
+            )
+        if len(base_spreads) != n or len(base_totals) != n:
+            raise ValueError("identity columns must have the same length as home_teams.")
+
+        # chaos / volatility are not used by the lines yet (see compute_lines).
+        return {
+            "home_team": list(home_teams),
+            "away_team": list(away_teams),
+            "model_spread": list(base_spreads),
+            "model_total": list(base_totals),
+        }
@@ -9,11 +9,15 @@ This module provides small, reusable tools used across all engines:
 - normalization
 - weighted averages
 - basic validators
+- read-only freezing / copying of result payloads
+- memoized team-code hashing
 
 None of these functions contain basketball logic. They are pure utilities.
 """
 
+import functools
 import math
+from types import MappingProxyType
 
 
 # ============================================================
@@ -99,6 +103,11 @@ def safe_float(x, fallback=0.0):
     """
     Convert x to float if possible; otherwise return fallback.
     """
+    # Exact-type checks skip the float() call for the common cases.
+    if type(x) is float:
+        return x
+    if type(x) is int:
+        return float(x)
     try:
         return float(x)
     except (ValueError, TypeError):
@@ -119,5 +128,66 @@ def bounded_mean(values, min_value=None, max_value=None):
     return mean_val
 
 
+# ============================================================
+# IMMUTABILITY UTILITIES
+# ============================================================
+
+def deep_freeze(value):
+    """
+    Return a read-only view of a nested dict/list payload.
+
+    dicts become MappingProxyType, lists/tuples become tuples; other values
+    are returned unchanged. Used for results that are cached and shared.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: deep_freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(deep_freeze(v) for v in value)
+    return value
+
+
+def copy_containers(value):
+    """
+    Return a copy of a nested dict/list payload with every dict and list
+    rebuilt; leaf values (and read-only mappings / tuples) are shared.
+    Used to hand out cached results that callers may mutate.
+    """
+    if isinstance(value, dict):
+        return {k: copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_containers(v) for v in value]
+    return value
+
+
+# ============================================================
+# MEMOIZATION SETTINGS
+# ============================================================
+
+# Max entries for each engine's compute_*_matchup cache: every ordered
+# pairing of a 32-team league fits.
+MATCHUP_CACHE_SIZE = 1024
+
+
+# ============================================================
+# HASHING UTILITIES
+# ============================================================
+
+@functools.lru_cache(maxsize=256)
+def team_code_hash(team_code):
+    """
+    Deterministic hash of a team code: the sum of its character codes
+    after upper/strip. Shared by the identity, chaos and volatility
+    engines; memoized since the same few codes recur on every call.
+    """
+    team_code = (team_code or "").upper().strip()
+    if not team_code:
+        return 0
+    try:
+        # sum() over bytes walks the C buffer; no per-char generator step
+        return sum(team_code.encode("ascii"))
+    except UnicodeEncodeError:
+        return sum(ord(ch) for ch in team_code)
+
+
 if __name__ == "__main__":
     print("utils.py loaded successfully.")
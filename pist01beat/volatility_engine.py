@@ -14,18 +14,37 @@ Interface:
 
     engine = VolatilityEngine()
     result = engine.compute_volatility("HOR", "DEN")
+
+    batch = engine.compute_volatility_batch(["HOR", "NYK"], ["DEN", "DET"])
+    # batch["volatility_score"], batch["volatility_flag"] (parallel lists)
+
+    from pist01beat.volatility_engine import compute_volatility_matchup
+    frozen = compute_volatility_matchup("HOR", "DEN")  # memoized, read-only dict
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
+import functools
+import sys
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Any, List, Mapping, Sequence, Tuple
+
+from .utils import MATCHUP_CACHE_SIZE, copy_containers, deep_freeze, team_code_hash
 
 
 ENGINE_VERSION = "3.4-volatility"
 
 
-@dataclass
+def _volatility_raw_hash(home_hash: int, away_hash: int) -> int:
+    """
+    Order-sensitive mix of two team hashes into 0..999.
+    The single definition used by every volatility path.
+    """
+    return (home_hash * 13 + away_hash * 29) % 1000
+
+
+@dataclass(slots=True)
 class VolatilityResult:
     engine: str
     engine_version: str
@@ -36,7 +55,26 @@ class VolatilityResult:
     debug: Dict[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "engine": self.engine,
+            "engine_version": self.engine_version,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "volatility_score": self.volatility_score,
+            "volatility_flag": self.volatility_flag,
+            "debug": self.debug,
+        }
+
+    def copy(self) -> "VolatilityResult":
+        return VolatilityResult(
+            self.engine,
+            self.engine_version,
+            self.home_team,
+            self.away_team,
+            self.volatility_score,
+            self.volatility_flag,
+            copy_containers(self.debug),
+        )
 
 
 class VolatilityEngine:
@@ -45,6 +83,16 @@ class VolatilityEngine:
     Maintains API symmetry with Chaos Engine for downstream integration.
     """
 
+    __slots__ = (
+        "base_floor",
+        "base_ceiling",
+        "low_threshold",
+        "high_threshold",
+        "_debug_params",
+        "_score_table",
+        "_flag_table",
+    )
+
     def __init__(
         self,
         base_floor: float = 0.10,
@@ -64,6 +112,21 @@ class VolatilityEngine:
         self.low_threshold = float(low_threshold)
         self.high_threshold = float(high_threshold)
 
+        self._debug_params: Dict[str, float] = {
+            "base_floor": self.base_floor,
+            "base_ceiling": self.base_ceiling,
+            "low_threshold": self.low_threshold,
+            "high_threshold": self.high_threshold,
+        }
+
+        # raw is always 0..999, so the score (raw mapped into
+        # [base_floor, base_ceiling]) and its label are table lookups.
+        span = self.base_ceiling - self.base_floor
+        self._score_table: Tuple[float, ...] = tuple(
+            self.base_floor + span * (raw / 999.0) for raw in range(1000)
+        )
+        self._flag_table: Tuple[str, ...] = tuple(self._label(score) for score in self._score_table)
+
     # ------------------------------------------------------------
     # INTERNAL HELPERS
     # ------------------------------------------------------------
@@ -72,25 +135,7 @@ class VolatilityEngine:
         """
         Deterministic hash from team code characters only.
         """
-        team_code = (team_code or "").upper().strip()
-        if not team_code:
-            return 0
-        return sum(ord(ch) for ch in team_code)
-
-    def _pair_hash(self, home_code: str, away_code: str) -> int:
-        """
-        Combine team-code hashes into a single deterministic number.
-        """
-        h = self._team_hash(home_code)
-        a = self._team_hash(away_code)
-        return (h * 13 + a * 29) % 1000  # 0..999
-
-    def _normalize(self, raw: int) -> float:
-        """
-        Map raw 0..999 into [base_floor, base_ceiling].
-        """
-        span = self.base_ceiling - self.base_floor
-        return self.base_floor + span * (raw / 999.0)
+        return team_code_hash(team_code)
 
     def _label(self, score: float) -> str:
         """
@@ -105,29 +150,44 @@ class VolatilityEngine:
     # ------------------------------------------------------------
     # PUBLIC API
     # ------------------------------------------------------------
-    def compute_volatility(self, home_team: str, away_team: str) -> VolatilityResult:
+    def compute_volatility(self, home_team: str, away_team: str, debug: bool = True) -> VolatilityResult:
         """
         Compute volatility_score and volatility_flag for a matchup.
+        result.debug is left empty when debug=False.
         """
         home_code = (home_team or "").upper().strip()
         away_code = (away_team or "").upper().strip()
 
-        raw = self._pair_hash(home_code, away_code)
-        volatility_score = self._normalize(raw)
+        return self.compute_volatility_hashed(
+            home_code,
+            away_code,
+            self._team_hash(home_code),
+            self._team_hash(away_code),
+            debug,
+        )
 
-        volatility_flag = self._label(volatility_score)
+    def compute_volatility_hashed(
+        self,
+        home_code: str,
+        away_code: str,
+        home_hash: int,
+        away_hash: int,
+        debug: bool = True,
+    ) -> VolatilityResult:
+        """
+        compute_volatility for codes already normalized (upper, stripped)
+        and hashed with utils.team_code_hash.
+        """
+        raw = _volatility_raw_hash(home_hash, away_hash)
+        volatility_score = self._score_table[raw]
+        volatility_flag = self._flag_table[raw]
 
-        debug: Dict[str, Any] = {
+        debug_info: Dict[str, Any] = {
             "home_code": home_code,
             "away_code": away_code,
             "raw_hash": raw,
-            "params": {
-                "base_floor": self.base_floor,
-                "base_ceiling": self.base_ceiling,
-                "low_threshold": self.low_threshold,
-                "high_threshold": self.high_threshold,
-            },
-        }
+            "params": dict(self._debug_params),
+        } if debug else {}
 
         return VolatilityResult(
             engine="volatility",
@@ -136,5 +196,81 @@ class VolatilityEngine:
             away_team=away_code,
             volatility_score=volatility_score,
             volatility_flag=volatility_flag,
-            debug=debug,
+            debug=debug_info,
         )
+
+    def compute_volatility_batch(
+        self,
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """
+        Compute volatility for many matchups in one pass.
+
+        Column-oriented counterpart of compute_volatility: returns parallel
+        lists (home_team, away_team, raw_hash, volatility_score,
+        volatility_flag) whose rows match compute_volatility exactly. No
+        per-matchup VolatilityResult or debug dict is built.
+        """
+        n = len(home_teams)
+        if len(away_teams) != n:
+            raise ValueError("home_teams and away_teams must have the same length.")
+
+        team_hash = self._team_hash
+        score_table = self._score_table
+        flag_table = self._flag_table
+
+        # A slate repeats a handful of codes: normalize (interned) and hash
+        # each distinct input once, then build every column from lookups.
+        codes: Dict[Any, Tuple[str, int]] = {}
+        for team in chain(home_teams, away_teams):
+            if team not in codes:
+                code = sys.intern((team or "").upper().strip())
+                codes[team] = (code, team_hash(code))
+
+        home_rows = [codes[team] for team in home_teams]
+        away_rows = [codes[team] for team in away_teams]
+        homes: List[str] = [code for code, _ in home_rows]
+        aways: List[str] = [code for code, _ in away_rows]
+        raw_hashes: List[int] = [
+            _volatility_raw_hash(home_hash, away_hash)
+            for (_, home_hash), (_, away_hash) in zip(home_rows, away_rows)
+        ]
+        scores: List[float] = [score_table[raw] for raw in raw_hashes]
+        flags: List[str] = [flag_table[raw] for raw in raw_hashes]
+
+        return {
+            "home_team": homes,
+            "away_team": aways,
+            "raw_hash": raw_hashes,
+            "volatility_score": scores,
+            "volatility_flag": flags,
+        }
+
+
+# ------------------------------------------------------------
+# MEMOIZED MATCHUP WRAPPER
+# ------------------------------------------------------------
+_DEFAULT_VOLATILITY_ENGINE = VolatilityEngine()
+
+
+@functools.lru_cache(maxsize=MATCHUP_CACHE_SIZE)
+def _compute_volatility_cached(home_code: str, away_code: str) -> Mapping[str, Any]:
+    return deep_freeze(_DEFAULT_VOLATILITY_ENGINE.compute_volatility(home_code, away_code).to_dict())
+
+
+def compute_volatility_matchup(home_team: str, away_team: str) -> Mapping[str, Any]:
+    """
+    Memoized compute_volatility with default engine params.
+
+    Returns a read-only view of VolatilityResult.to_dict() so cached results
+    can be shared. Use clear_volatility_matchup_cache() to reset.
+    """
+    home_code = (home_team or "").upper().strip()
+    away_code = (away_team or "").upper().strip()
+    return _compute_volatility_cached(home_code, away_code)
+
+
+def clear_volatility_matchup_cache() -> None:
+    """Drop every memoized compute_volatility_matchup result."""
+    _compute_volatility_cached.cache_clear()
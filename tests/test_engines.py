@@ -0,0 +1,172 @@
+import unittest
+
+from pist01beat.chaos_engine import ChaosEngine, clear_chaos_matchup_cache, compute_chaos_matchup
+from pist01beat.identity_engine import IdentityEngine, clear_identity_matchup_cache, compute_identity_matchup
+from pist01beat.integration_engine import IntegrationEngine
+from pist01beat.spread_engine import SpreadEngine
+from pist01beat.volatility_engine import (
+    VolatilityEngine,
+    clear_volatility_matchup_cache,
+    compute_volatility_matchup,
+)
+
+CODES = ["HOR", "DEN", "nyk", " det ", "OKC", "LAL", "", "x"]
+NOTES = [None, "", "injury_uncertainty, rotation_noise", "a,b,c,d", " , ,x", ["Rest", " b2b "]]
+
+HOMES = [h for h in CODES for _ in CODES]
+AWAYS = [a for _ in CODES for a in CODES]
+VALID = [(h, a) for h, a in zip(HOMES, AWAYS) if h.strip() and a.strip() and h.strip() != a.strip()]
+
+
+class BatchScalarParityTest(unittest.TestCase):
+    def test_identity_batch_matches_compute_identity(self):
+        engine = IdentityEngine()
+        batch = engine.compute_identity_batch(HOMES, AWAYS)
+        for i, (home, away) in enumerate(zip(HOMES, AWAYS)):
+            result = engine.compute_identity(home, away)
+            for column in batch:
+                with self.subTest(home=home, away=away, column=column):
+                    self.assertEqual(batch[column][i], getattr(result, column))
+
+    def test_chaos_batch_matches_compute_chaos(self):
+        engine = ChaosEngine()
+        for notes in NOTES:
+            batch = engine.compute_chaos_batch(HOMES, AWAYS, [notes] * len(HOMES))
+            for i, (home, away) in enumerate(zip(HOMES, AWAYS)):
+                result = engine.compute_chaos(home, away, notes)
+                with self.subTest(home=home, away=away, notes=notes):
+                    self.assertEqual(batch["home_team"][i], result.home_team)
+                    self.assertEqual(batch["away_team"][i], result.away_team)
+                    self.assertEqual(batch["raw_hash"][i], result.debug["raw_hash"])
+                    self.assertEqual(batch["chaos_score"][i], result.chaos_score)
+                    self.assertEqual(batch["chaos_flag"][i], result.chaos_flag)
+
+    def test_volatility_batch_matches_compute_volatility(self):
+        engine = VolatilityEngine()
+        batch = engine.compute_volatility_batch(HOMES, AWAYS)
+        for i, (home, away) in enumerate(zip(HOMES, AWAYS)):
+            result = engine.compute_volatility(home, away)
+            with self.subTest(home=home, away=away):
+                self.assertEqual(batch["home_team"][i], result.home_team)
+                self.assertEqual(batch["away_team"][i], result.away_team)
+                self.assertEqual(batch["raw_hash"][i], result.debug["raw_hash"])
+                self.assertEqual(batch["volatility_score"][i], result.volatility_score)
+                self.assertEqual(batch["volatility_flag"][i], result.volatility_flag)
+
+    def test_spread_batch_matches_compute_lines(self):
+        identity_engine, chaos_engine = IdentityEngine(), ChaosEngine()
+        volatility_engine, spread_engine = VolatilityEngine(), SpreadEngine()
+        identity = identity_engine.compute_identity_batch(HOMES, AWAYS)
+        batch = spread_engine.compute_lines_batch(
+            identity["home_team"],
+            identity["away_team"],
+            identity,
+            chaos_engine.compute_chaos_batch(HOMES, AWAYS),
+            volatility_engine.compute_volatility_batch(HOMES, AWAYS),
+        )
+        for i, (home, away) in enumerate(zip(HOMES, AWAYS)):
+            id_result = identity_engine.compute_identity(home, away)
+            lines = spread_engine.compute_lines(
+                id_result.home_team,
+                id_result.away_team,
+                id_result,
+                chaos_engine.compute_chaos(home, away),
+                volatility_engine.compute_volatility(home, away),
+            )
+            with self.subTest(home=home, away=away):
+                self.assertEqual(batch["home_team"][i], lines.home_team)
+                self.assertEqual(batch["away_team"][i], lines.away_team)
+                self.assertEqual(batch["model_spread"][i], lines.model_spread)
+                self.assertEqual(batch["model_total"][i], lines.model_total)
+
+
+class MatchupCacheTest(unittest.TestCase):
+    def setUp(self):
+        clear_identity_matchup_cache()
+        clear_chaos_matchup_cache()
+        clear_volatility_matchup_cache()
+
+    def test_matchup_wrappers_match_uncached_results(self):
+        identity_engine, chaos_engine, volatility_engine = IdentityEngine(), ChaosEngine(), VolatilityEngine()
+        for home, away in VALID:
+            with self.subTest(home=home, away=away):
+                self.assertEqual(
+                    compute_identity_matchup(home, away),
+                    identity_engine.compute_identity(home, away).to_dict(),
+                )
+                self.assertEqual(
+                    compute_volatility_matchup(home, away),
+                    volatility_engine.compute_volatility(home, away).to_dict(),
+                )
+                for notes in NOTES:
+                    cached = compute_chaos_matchup(home, away, notes)
+                    expected = chaos_engine.compute_chaos(home, away, notes).to_dict()
+                    self.assertEqual(cached["chaos_score"], expected["chaos_score"])
+                    self.assertEqual(cached["chaos_flag"], expected["chaos_flag"])
+                    self.assertEqual(list(cached["drivers"]), expected["drivers"])
+                    self.assertEqual(list(cached["debug"]["note_tags"]), expected["debug"]["note_tags"])
+
+    def test_matchup_wrappers_are_read_only(self):
+        cached = compute_chaos_matchup("HOR", "DEN", "rest")
+        with self.assertRaises(TypeError):
+            cached["chaos_score"] = 0.0
+        with self.assertRaises(TypeError):
+            cached["debug"]["params"]["base_floor"] = 0.0
+
+
+class IntegrationCacheTest(unittest.TestCase):
+    def test_cached_results_match_uncached(self):
+        cached, uncached = IntegrationEngine(debug=True), IntegrationEngine(cache_size=0, debug=True)
+        for home, away in VALID:
+            for notes in NOTES:
+                with self.subTest(home=home, away=away, notes=notes):
+                    first = cached.run(home, away, notes)
+                    again = cached.run(home, away, notes)
+                    fresh = uncached.run(home, away, notes)
+                    for part in ("identity", "chaos", "volatility", "spread"):
+                        self.assertEqual(again[part].to_dict(), fresh[part].to_dict())
+                        self.assertEqual(first[part].to_dict(), fresh[part].to_dict())
+
+    def test_returned_results_are_isolated_from_the_cache(self):
+        engine = IntegrationEngine(debug=True)
+        first = engine.run("HOR", "DEN", "rest")
+        expected = {part: first[part].to_dict() for part in ("identity", "chaos", "volatility", "spread")}
+        # to_dict() shares nested containers with the result; snapshot them.
+        expected["chaos"]["drivers"] = list(expected["chaos"]["drivers"])
+        expected["chaos"]["debug"] = dict(expected["chaos"]["debug"], params=dict(expected["chaos"]["debug"]["params"]))
+
+        first["chaos"].chaos_score = -1.0
+        first["chaos"].drivers.append("mutated")
+        first["chaos"].debug["params"]["base_floor"] = -1.0
+        first["identity"].debug["params"]["power_scale"] = -1.0
+        first["spread"].model_spread = -1.0
+
+        second = engine.run("HOR", "DEN", "rest")
+        self.assertEqual(second["chaos"].to_dict(), expected["chaos"])
+        self.assertEqual(second["identity"].to_dict()["debug"]["params"]["power_scale"], 25.0)
+        self.assertEqual(second["spread"].to_dict(), expected["spread"])
+
+    def test_equivalent_notes_share_one_cache_entry(self):
+        engine = IntegrationEngine()
+        engine.run("HOR", "DEN", "a, b")
+        engine.run("HOR", "DEN", ["A", " b "])
+        self.assertEqual(len(engine._result_cache), 1)
+
+    def test_cache_size_bounds_entries(self):
+        engine = IntegrationEngine(cache_size=2)
+        for away in ("DEN", "NYK", "DET"):
+            engine.run("HOR", away)
+        self.assertEqual(list(engine._result_cache), [("HOR", "NYK", ()), ("HOR", "DET", ())])
+        engine.clear_cache()
+        self.assertEqual(len(engine._result_cache), 0)
+
+    def test_debug_is_fixed_for_the_instance(self):
+        engine = IntegrationEngine()
+        self.assertEqual(engine.run("HOR", "DEN")["chaos"].debug, {})
+        with self.assertRaises(AttributeError):
+            engine.debug = True
+        self.assertTrue(IntegrationEngine(debug=True).run("HOR", "DEN")["chaos"].debug)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from pist01beat import Pist01Beat
+
+CODES = ["HOR", "DEN", "nyk", " det ", "OKC", "LAL", "", "x"]
+
+
+class PredictBatchParityTest(unittest.TestCase):
+    def test_predict_batch_matches_predict_row_by_row(self):
+        model = Pist01Beat()
+        homes = [h for h in CODES for _ in CODES]
+        aways = [a for _ in CODES for a in CODES]
+        batch = model.predict_batch(homes, aways)
+
+        self.assertEqual(batch["home_team"], homes)
+        self.assertEqual(batch["away_team"], aways)
+
+        for i, (home, away) in enumerate(zip(homes, aways)):
+            with self.subTest(home=home, away=away):
+                single = model.predict(home, away)
+                chaos = single["debug"].get("chaos")
+                self.assertEqual(batch["model_spread"][i], single["model_spread"])
+                self.assertEqual(batch["model_total"][i], single["model_total"])
+                self.assertEqual(batch["chaos_score"][i], None if chaos is None else chaos.chaos_score)
+                self.assertEqual(batch["chaos_flag"][i], None if chaos is None else chaos.chaos_flag)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from pist01beat.ops.repo_snapshot import build_repo_snapshot
+
+
+class RepoSnapshotHashCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        os.mkdir(os.path.join(self.root, ".git"))
+        self.path = os.path.join(self.root, "data.txt")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write_keeping_mtime(self, content, mtime_ns=None):
+        with open(self.path, "wb") as f:
+            f.write(content)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+        return os.stat(self.path).st_mtime_ns
+
+    def _sha(self, **kwargs):
+        snap = build_repo_snapshot(repo_root=self.root, hash_workers=1, **kwargs)
+        (row,) = snap["files"]
+        return row["sha256"]
+
+    def test_same_size_same_mtime_rewrite_is_caught_by_default(self):
+        mtime_ns = self._write_keeping_mtime(b"aaaa")
+        # Prime the in-process memo, as an earlier opt-in caller would.
+        before = self._sha(use_hash_cache=True)
+
+        self._write_keeping_mtime(b"bbbb", mtime_ns)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime_ns)
+
+        after = self._sha()
+        self.assertNotEqual(after, before)
+        self.assertEqual(after, self._sha(use_hash_cache=False))
+
+    def test_hash_cache_is_opt_in_and_trusts_metadata(self):
+        mtime_ns = self._write_keeping_mtime(b"aaaa")
+        before = self._sha(use_hash_cache=True)
+
+        self._write_keeping_mtime(b"bbbb", mtime_ns)
+        self.assertEqual(self._sha(use_hash_cache=True), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import hashlib
+import os
+import tempfile
+import unittest
+
+from pist01beat.ops.repo_snapshot import _HASH_CHUNK_BYTES, _sha256_file
+from pist01beat.ops.util_hash import sha256_file
+
+SIZES = [0, 1, _HASH_CHUNK_BYTES - 1, _HASH_CHUNK_BYTES, _HASH_CHUNK_BYTES + 1, 3 * _HASH_CHUNK_BYTES + 7]
+
+
+class FileDigestTest(unittest.TestCase):
+    def test_file_hashes_match_hashlib_around_chunk_boundaries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for size in SIZES:
+                data = os.urandom(size)
+                path = os.path.join(tmp, f"f{size}")
+                with open(path, "wb") as f:
+                    f.write(data)
+                expected = hashlib.sha256(data).hexdigest()
+                with self.subTest(size=size):
+                    self.assertEqual(_sha256_file(path), expected)
+                    self.assertEqual(sha256_file(path), expected)
+                    self.assertEqual(sha256_file(path, chunk_size=4096), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()